@@ -1,4 +1,5 @@
 import os
+from typing import Literal
 
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings, JsonConfigSettingsSource, SettingsConfigDict
@@ -75,6 +76,13 @@ class GameStatsSettings(BaseModel):
     enabled: bool = Field(default=True)
 
 
+class ReportSettings(BaseModel):
+    """Match report file settings."""
+
+    # Files saved per submitted report: none, raw (.bin only) or both (.bin and parsed .json)
+    dump_mode: Literal["none", "raw", "both"] = Field(default="none")
+
+
 # Compute config path at module load time for frozen executable support
 _config_path = os.path.join(get_runtime_path(), "config.json")
 
@@ -89,6 +97,7 @@ class AppSettings(BaseSettings):
     gamestats: GameStatsSettings = Field(default_factory=GameStatsSettings)
     game: GameSettings = Field()
     logging: LoggingSettings = Field(default_factory=LoggingSettings)
+    reports: ReportSettings = Field(default_factory=ReportSettings)
 
     model_config = SettingsConfigDict(
         json_file=_config_path,
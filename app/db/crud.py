@@ -6,6 +6,7 @@ from datetime import datetime
 
 from sqlmodel import Session, select
 
+from app.models.match_report import MatchReportData
 from app.models.models import (
     AuthCertificate,
     BuddyRequest,
@@ -747,6 +748,8 @@ def update_player_elo(
     """
     Update a player's ELO rating after a match.
 
+    Changes are only flushed; the caller commits.
+
     Args:
         session: Database session.
         persona_id: Player's persona ID.
@@ -762,8 +765,6 @@ def update_player_elo(
     if stats is None:
         stats = PlayerStats(persona_id=persona_id)
         session.add(stats)
-        session.commit()
-        session.refresh(stats)
 
     # Map game type to field names
     elo_field = f"elo_{game_type}"
@@ -789,8 +790,7 @@ def update_player_elo(
     stats.updated_at = datetime.utcnow()
 
     session.add(stats)
-    session.commit()
-    session.refresh(stats)
+    session.flush()
     return stats
 
 
@@ -804,6 +804,8 @@ def update_player_win_loss(
     """
     Update a player's win/loss/disconnect/dsync counters.
 
+    Changes are only flushed; the caller commits.
+
     Args:
         session: Database session.
         persona_id: Player's persona ID.
@@ -818,8 +820,6 @@ def update_player_win_loss(
     if stats is None:
         stats = PlayerStats(persona_id=persona_id)
         session.add(stats)
-        session.commit()
-        session.refresh(stats)
 
     # Update win/loss/dc/dsync counters
     if result == 0:  # Win
@@ -865,8 +865,7 @@ def update_player_win_loss(
     stats.updated_at = datetime.utcnow()
 
     session.add(stats)
-    session.commit()
-    session.refresh(stats)
+    session.flush()
     return stats
 
 
@@ -1034,7 +1033,7 @@ def submit_match_report(
     csid: str,
     ccid: str,
     persona_id: int,
-    report_data: dict,
+    report_data: MatchReportData,
 ) -> MatchReport:
     """
     Submits a match report.
@@ -1049,7 +1048,17 @@ def submit_match_report(
     Returns:
         Created MatchReport
     """
-    report = MatchReport(
+    report = _build_match_report(csid, ccid, persona_id, report_data)
+
+    session.add(report)
+    session.commit()
+    session.refresh(report)
+    return report
+
+
+def _build_match_report(csid: str, ccid: str, persona_id: int, report_data: MatchReportData) -> MatchReport:
+    """Builds a MatchReport row from the parsed report data."""
+    return MatchReport(
         csid=csid,
         ccid=ccid,
         persona_id=persona_id,
@@ -1061,10 +1070,53 @@ def submit_match_report(
         map_name=report_data.get("map_name", ""),
     )
 
-    session.add(report)
-    session.commit()
-    session.refresh(report)
-    return report
+
+def submit_and_complete(
+    session: Session,
+    csid: str,
+    ccid: str,
+    persona_id: int,
+    report_data: MatchReportData,
+    full_id: str = "",
+    complete: bool = True,
+) -> CompetitionSession | None:
+    """
+    Submits a match report and updates its competition session in one transaction.
+
+    Combines submit_match_report, mark_report_intent_reported, increment_received_reports
+    and complete_competition_session. Changes are only flushed; the caller commits.
+
+    Args:
+        session: Database session
+        csid: Competition Session ID
+        ccid: Competition Channel ID of the reporter
+        persona_id: Persona ID of reporter
+        report_data: Match report data (result, faction, duration, gametype, map_name)
+        full_id: Player's full GUID from the report, stored on the report intent
+        complete: Whether to mark the competition session as completed
+
+    Returns:
+        The updated CompetitionSession, or None if csid is unknown
+    """
+    session.add(_build_match_report(csid, ccid, persona_id, report_data))
+
+    if ccid:
+        intent = get_report_intent_by_ccid(session, ccid)
+        if intent:
+            intent.reported = True
+            if full_id:
+                intent.full_id = full_id
+            session.add(intent)
+
+    comp_session = get_competition_session(session, csid)
+    if comp_session:
+        comp_session.received_reports += 1
+        if complete:
+            comp_session.status = "completed"
+        session.add(comp_session)
+
+    session.flush()
+    return comp_session
 
 
 def complete_competition_session(session: Session, csid: str) -> bool:
@@ -1101,6 +1153,7 @@ def finalize_match(session: Session, csid: str) -> bool:
 
     This function should be called when all reports have been received.
     It correlates winners/losers from the reports and updates player stats.
+    Changes are only flushed; the caller commits.
 
     Args:
         session: Database session.
@@ -1194,7 +1247,7 @@ def finalize_match(session: Session, csid: str) -> bool:
     comp_session.finalized = True
     comp_session.status = "completed"
     session.add(comp_session)
-    session.commit()
+    session.flush()
 
     return True
 
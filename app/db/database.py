@@ -1,4 +1,6 @@
 import os
+from collections.abc import Iterator
+from contextlib import contextmanager
 
 from sqlmodel import Session, SQLModel, create_engine
 
@@ -12,7 +14,17 @@ DATABASE_URL = f"sqlite:///{_db_path}"
 # The engine is the central point of communication with the database.
 # connect_args is needed only for SQLite to allow sharing the connection
 # across different threads, which is important for FastAPI.
-engine = create_engine(DATABASE_URL, echo=True, connect_args={"check_same_thread": False})
+# Connections are pooled so per-request sessions only check out an existing
+# connection instead of opening a new one.
+engine = create_engine(
+    DATABASE_URL,
+    echo=True,
+    connect_args={"check_same_thread": False},
+    pool_size=32,
+    max_overflow=16,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+)
 
 
 def create_db_and_tables():
@@ -32,6 +44,40 @@ def get_session():
         yield session
 
 
+@contextmanager
+def session_scope() -> Iterator[Session]:
+    """
+    Provide a session wrapped in a single transaction.
+    The session is committed when the block succeeds, rolled back if it
+    raises, and always closed afterwards.
+
+    Handlers that turn errors into SOAP faults return normally, so a failed
+    flush can still leave the transaction needing a rollback; it is rolled back
+    then instead of committed.
+    """
+    session = Session(engine)
+    try:
+        yield session
+        if session.is_active:
+            session.commit()
+        else:
+            session.rollback()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def get_db():
+    """
+    A dependency function that yields a session wrapped in a single transaction
+    for the request (see session_scope).
+    """
+    with session_scope() as session:
+        yield session
+
+
 def create_session() -> Session:
     """
     Create a new database session for manual lifecycle management.
@@ -0,0 +1,158 @@
+"""
+Group commit for match report writes.
+
+Every SubmitReport used to run its database work in its own transaction, so
+concurrent match completions each paid for a separate commit (and SQLite fsync).
+The ReportBatcher funnels those writes through a single worker: reports that
+arrive while a batch is being written are stored together in one session and
+committed once.
+
+Store functions only flush their changes; the batcher owns the commit. If a batch
+fails, it is rolled back and each store is retried in its own transaction so one
+bad report cannot fail the others.
+"""
+
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+from fastapi.concurrency import run_in_threadpool
+from sqlmodel import Session
+
+from app.db.database import create_session
+from app.util.logging_helper import get_logger
+
+logger = get_logger(__name__)
+
+# (store function, its arguments after the session, future resolved with its result)
+_PendingStore = tuple[Callable[..., Any], tuple[Any, ...], asyncio.Future]
+
+
+class ReportBatcher:
+    """Queue of report store functions, written in batches by one background task."""
+
+    def __init__(self, max_batch_size: int = 50):
+        """
+        Args:
+            max_batch_size: Maximum number of stores committed in one transaction.
+        """
+        self.max_batch_size = max_batch_size
+        self._queue: asyncio.Queue[_PendingStore | None] | None = None
+        self._worker: asyncio.Task | None = None
+
+    def start(self) -> None:
+        """Start the background worker on the running event loop."""
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Write any queued stores and stop the background worker."""
+        if self._worker is None:
+            return
+        worker, self._worker = self._worker, None
+        # New submissions now run directly; the sentinel ends the worker after the queued ones
+        await self._queue.put(None)
+        await worker
+        self._queue = None
+
+    async def submit(self, store: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run store(session, *args) in the next batch and wait for it to be committed.
+
+        Falls back to running it in its own transaction when the worker is not running
+        (e.g. outside the application lifespan, or if the worker task has died).
+
+        Returns:
+            The store function's return value.
+        """
+        if self._worker is None or self._worker.done():
+            return await run_in_threadpool(self._store_one, store, args)
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((store, args, future))
+        return await future
+
+    async def _run(self) -> None:
+        """Write batches until the stop sentinel is received."""
+        while True:
+            first = await self._queue.get()
+            if first is None:
+                return
+            # Take everything already queued, up to the batch size, without waiting for more
+            batch = [first]
+            stopping = False
+            while len(batch) < self.max_batch_size and not self._queue.empty():
+                pending = self._queue.get_nowait()
+                if pending is None:
+                    stopping = True
+                    break
+                batch.append(pending)
+            await self._write_batch(batch)
+            if stopping:
+                return
+
+    async def _write_batch(self, batch: list[_PendingStore]) -> None:
+        """Store a batch in the threadpool and resolve each caller's future."""
+        try:
+            results = await run_in_threadpool(self._store_batch, [(store, args) for store, args, _ in batch])
+        except Exception as e:
+            # Session setup or cleanup failed outside the per-store handling; fail this
+            # batch's callers but keep the worker alive for the next batch
+            logger.exception("Report batch of %d failed: %s", len(batch), e)
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, _, future), (result, error) in zip(batch, results):
+            if future.done():
+                continue
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+    def _store_batch(
+        self, stores: list[tuple[Callable[..., Any], tuple[Any, ...]]]
+    ) -> list[tuple[Any, Exception | None]]:
+        """Run a batch of stores in one session with a single commit."""
+        session = create_session()
+        try:
+            results = [store(session, *args) for store, args in stores]
+            session.commit()
+            if len(stores) > 1:
+                logger.debug("Report batch: committed %d stores in one transaction", len(stores))
+            return [(result, None) for result in results]
+        except Exception as e:
+            session.rollback()
+            if len(stores) == 1:
+                return [(None, e)]
+            logger.warning("Report batch of %d failed (%s), retrying stores individually", len(stores), e)
+        finally:
+            session.close()
+
+        outcomes = []
+        for store, args in stores:
+            try:
+                outcomes.append((self._store_one(store, args), None))
+            except Exception as e:
+                outcomes.append((None, e))
+        return outcomes
+
+    @staticmethod
+    def _store_one(store: Callable[..., Any], args: tuple[Any, ...]) -> Any:
+        """Run a single store in its own transaction."""
+        session: Session = create_session()
+        try:
+            result = store(session, *args)
+            session.commit()
+            return result
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+
+# Shared batcher for SubmitReport database writes, started in the application lifespan
+report_batcher = ReportBatcher()
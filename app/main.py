@@ -9,6 +9,7 @@ from fastapi.staticfiles import StaticFiles
 from app._version import __version__
 from app.config.app_settings import app_config
 from app.db.database import create_db_and_tables
+from app.db.report_batcher import report_batcher
 from app.rest.routes import clans_api_router
 from app.rest.routes import router as rest_router
 from app.servers.fesl_server import start_fesl_server
@@ -45,6 +46,9 @@ async def lifespan(app: FastAPI):
 
     session_manager = SessionManager()
 
+    # Start the match report writer (groups concurrent SubmitReport writes into one commit)
+    report_batcher.start()
+
     # Start FESL server
     fesl_host = app_config.fesl.host
     fesl_port = app_config.fesl.port
@@ -147,6 +151,9 @@ async def lifespan(app: FastAPI):
     if relay_server:
         await relay_server.stop()
 
+    # Write any queued match reports
+    await report_batcher.stop()
+
 
 # Create the main FastAPI application
 app = FastAPI(
@@ -9,7 +9,7 @@ import struct
 import uuid
 from dataclasses import dataclass, field
 from enum import IntEnum
-from typing import Any
+from typing import Any, TypedDict
 
 
 class Faction:
@@ -82,7 +82,7 @@ def get_faction_from_key(key: int) -> tuple[str, int]:
     return faction, game_type
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchPlayer:
     """Represents a player in a match."""
 
@@ -94,7 +94,17 @@ class MatchPlayer:
     persona_id_valid: bool = True  # False if persona_id looks corrupted
 
 
-@dataclass
+class MatchReportData(TypedDict, total=False):
+    """Submitter's result extracted from a parsed report, stored as a MatchReport row."""
+
+    result: int
+    faction: str
+    duration: int
+    gametype: int
+    map_name: str
+
+
+@dataclass(slots=True)
 class Roster:
     """Roster entry with player ID and team ID."""
 
@@ -102,7 +112,7 @@ class Roster:
     team_id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class DataValue:
     """A typed data value from the report."""
 
@@ -110,7 +120,7 @@ class DataValue:
     value: Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ParsedPlayer:
     """Parsed player information."""
 
@@ -122,62 +132,84 @@ class ParsedPlayer:
     player_id_valid: bool = True  # False if persona_id looks corrupted
 
 
+# Fixed-size data value encodings, keyed by value type (STRING is length-prefixed)
+_VALUE_STRUCTS: dict[ValueType, struct.Struct] = {
+    ValueType.INT32: struct.Struct(">i"),
+    ValueType.INT16: struct.Struct(">h"),
+    ValueType.BYTE: struct.Struct(">B"),
+}
+
+
+# Fixed-size integer encodings read by BinaryReader
+_UINT32_BE = struct.Struct(">I")
+_INT32_BE = struct.Struct(">i")
+_UINT16_BE = struct.Struct(">H")
+_INT16_BE = struct.Struct(">h")
+
+
 class BinaryReader:
-    """Helper class to read binary data with a cursor."""
+    """
+    Helper class to read binary data with a cursor.
+
+    The data is held as a memoryview, so read_bytes and the section readers
+    built from it are views into the original buffer rather than copies.
+    """
 
-    def __init__(self, data: bytes):
-        self.data = data
-        self.pos = 0
+    def __init__(self, data: bytes | memoryview, pos: int = 0):
+        self.data = memoryview(data)
+        self.pos = pos
 
-    def read_bytes(self, length: int) -> bytes:
-        """Read a specific number of bytes."""
+    def read_bytes(self, length: int) -> memoryview:
+        """Read a specific number of bytes, as a view into the data."""
         result = self.data[self.pos : self.pos + length]
         self.pos += length
         return result
 
+    def _unpack(self, value_struct: struct.Struct) -> int:
+        """Unpack a single fixed-size value at the cursor and advance past it."""
+        (value,) = value_struct.unpack_from(self.data, self.pos)
+        self.pos += value_struct.size
+        return value
+
     def read_uint32_be(self) -> int:
         """Read a big-endian unsigned 32-bit integer."""
-        return struct.unpack(">I", self.read_bytes(4))[0]
+        return self._unpack(_UINT32_BE)
 
     def read_int32_be(self) -> int:
         """Read a big-endian signed 32-bit integer."""
-        return struct.unpack(">i", self.read_bytes(4))[0]
+        return self._unpack(_INT32_BE)
 
     def read_uint16_be(self) -> int:
         """Read a big-endian unsigned 16-bit integer."""
-        return struct.unpack(">H", self.read_bytes(2))[0]
+        return self._unpack(_UINT16_BE)
 
     def read_int16_be(self) -> int:
         """Read a big-endian signed 16-bit integer."""
-        return struct.unpack(">h", self.read_bytes(2))[0]
+        return self._unpack(_INT16_BE)
 
     def read_byte(self) -> int:
         """Read a single byte."""
-        return self.read_bytes(1)[0]
+        value = self.data[self.pos]
+        self.pos += 1
+        return value
 
     def read_string(self) -> str:
         """Read a length-prefixed UTF-8 string."""
         length = self.read_byte()
-        return self.read_bytes(length).decode("utf-8", errors="replace")
+        return str(self.read_bytes(length), "utf-8", "replace")
 
     def read_guid(self) -> uuid.UUID:
         """Read a 16-byte UUID."""
-        return uuid.UUID(bytes=self.read_bytes(16))
+        return uuid.UUID(bytes=bytes(self.read_bytes(16)))
 
     def read_data_value(self) -> DataValue:
         """Read a typed data value."""
+        # ValueType() raises ValueError for unknown types
         value_type = ValueType(self.read_uint16_be())
-        if value_type == ValueType.INT32:
-            value = self.read_int32_be()
-        elif value_type == ValueType.INT16:
-            value = self.read_int16_be()
-        elif value_type == ValueType.BYTE:
-            value = self.read_byte()
-        elif value_type == ValueType.STRING:
-            value = self.read_string()
-        else:
-            raise ValueError(f"Unknown value type: {value_type}")
-        return DataValue(value_type=value_type, value=value)
+        value_struct = _VALUE_STRUCTS.get(value_type)
+        if value_struct is None:
+            return DataValue(value_type=value_type, value=self.read_string())
+        return DataValue(value_type=value_type, value=self._unpack(value_struct))
 
     def remaining(self) -> int:
         """Return the number of bytes remaining."""
@@ -188,6 +220,11 @@ class BinaryReader:
         return self.pos >= len(self.data)
 
 
+# Fixed-size report header: versions, checksum, status/flags, counts, padding
+# and the six section lengths, decoded with a single unpack_from call
+REPORT_HEADER = struct.Struct(">II16sIIHHHHH2xiiiiii")
+
+
 @dataclass
 class MatchReport:
     """
@@ -217,29 +254,35 @@ class MatchReport:
     is_auto_match: bool = False
 
     @classmethod
-    def from_bytes(cls, data: bytes) -> "MatchReport":
-        """Parse a match report from binary data."""
-        reader = BinaryReader(data)
+    def from_bytes(cls, data: bytes | memoryview) -> "MatchReport":
+        """
+        Parse a match report from binary data (bytes or a memoryview into the request body).
 
+        Sections are read through memoryviews of the data, so only the values
+        themselves are copied out.
+        """
+        data = memoryview(data)
         report = cls()
-        report.protocol_version = reader.read_uint32_be()
-        report.developer_version = reader.read_uint32_be()
-        report.checksum = reader.read_bytes(16)
-        report.game_status = reader.read_uint32_be()
-        report.flags = reader.read_uint32_be()
-        report.player_count = reader.read_uint16_be()
-        report.team_count = reader.read_uint16_be()
-        report.game_key_count = reader.read_uint16_be()
-        report.player_key_count = reader.read_uint16_be()
-        report.team_key_count = reader.read_uint16_be()
-        reader.read_bytes(2)  # padding
-
-        roster_section_length = reader.read_int32_be()
-        auth_section_length = reader.read_int32_be()
-        result_section_length = reader.read_int32_be()
-        game_section_length = reader.read_int32_be()
-        player_section_length = reader.read_int32_be()
-        team_section_length = reader.read_int32_be()
+        (
+            report.protocol_version,
+            report.developer_version,
+            report.checksum,
+            report.game_status,
+            report.flags,
+            report.player_count,
+            report.team_count,
+            report.game_key_count,
+            report.player_key_count,
+            report.team_key_count,
+            roster_section_length,
+            auth_section_length,
+            result_section_length,
+            game_section_length,
+            player_section_length,
+            team_section_length,
+        ) = REPORT_HEADER.unpack_from(data, 0)
+
+        reader = BinaryReader(data, REPORT_HEADER.size)
 
         # Roster section
         roster_data = BinaryReader(reader.read_bytes(roster_section_length))
@@ -249,10 +292,10 @@ class MatchReport:
             report.roster_section.append(Roster(player_id=player_id, team_id=team_id))
 
         # Auth section
-        report.auth_section = reader.read_bytes(auth_section_length)
+        report.auth_section = bytes(reader.read_bytes(auth_section_length))
 
         # Result section
-        report.result_section = reader.read_bytes(result_section_length)
+        report.result_section = bytes(reader.read_bytes(result_section_length))
 
         # Game section
         game_data = BinaryReader(reader.read_bytes(game_section_length))
@@ -11,21 +11,26 @@ computed over actual player data.
 """
 
 import base64
-from datetime import datetime
+import binascii
+import logging
+import time
+from functools import lru_cache
 
-from fastapi import APIRouter, Request, Response
-from sqlmodel import select
+from fastapi import APIRouter, Depends, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from sqlmodel import Session, select
 
-from app.db.database import create_session
+from app.db.database import get_db
 from app.models.models import Persona, User
 from app.soap.envelope import (
+    SoapTemplate,
     create_soap_fault,
     extract_soap_body,
     get_element_text,
     get_operation_name,
-    wrap_soap_envelope,
+    wrap_soap_envelope_bytes,
 )
-from app.soap.models.auth import LoginRemoteAuthResponse, LoginResponseCode
+from app.soap.models.auth import Certificate, LoginRemoteAuthResponse, LoginRemoteAuthResult, LoginResponseCode
 from app.util.gamespy_crypto import GeneratedCertificate, generate_certificate_for_player
 from app.util.logging_helper import get_logger
 
@@ -37,6 +42,48 @@ auth_router = APIRouter()
 _profile_certificates: dict[int, GeneratedCertificate] = {}
 
 
+def _build_login_success_template() -> SoapTemplate:
+    """Pre-render the LoginRemoteAuth success envelope with a placeholder for each per-player field."""
+    certificate = Certificate.model_construct(
+        userid="__USERID__",
+        profileid="__PROFILEID__",
+        profilenick="__NICKNAME__",
+        uniquenick="__NICKNAME__",
+        email="__EMAIL__",
+        peerkeymodulus="__PEERKEYMODULUS__",
+        serverdata="__SERVERDATA__",
+        signature="__SIGNATURE__",
+        timestamp="__TIMESTAMP__",
+    )
+    response = LoginRemoteAuthResponse.model_construct(
+        result=LoginRemoteAuthResult.model_construct(
+            response_code=LoginResponseCode.SUCCESS,
+            certificate=certificate,
+            peerkeyprivate="__PEERKEYPRIVATE__",
+        )
+    )
+    return SoapTemplate(
+        response,
+        (
+            "__USERID__",
+            "__PROFILEID__",
+            "__NICKNAME__",
+            "__EMAIL__",
+            "__PEERKEYMODULUS__",
+            "__SERVERDATA__",
+            "__SIGNATURE__",
+            "__TIMESTAMP__",
+            "__PEERKEYPRIVATE__",
+        ),
+    )
+
+
+# Success responses are rendered from this template instead of serializing the pydantic_xml model
+_LOGIN_SUCCESS_TEMPLATE = _build_login_success_template()
+
+_UNKNOWN_OPERATION_FAULT = create_soap_fault("Unknown operation").encode("utf-8")
+
+
 def parse_authtoken(authtoken: str) -> tuple[int, int]:
     """
     Parse the authtoken to extract user_id and persona_id.
@@ -47,7 +94,8 @@ def parse_authtoken(authtoken: str) -> tuple[int, int]:
         Tuple of (user_id, persona_id).
     """
     try:
-        decoded = base64.b64decode(authtoken).decode("utf-8")
+        # a2b_base64 accepts the ASCII str directly and skips b64decode's wrapper
+        decoded = binascii.a2b_base64(authtoken).decode("utf-8")
         parts = decoded.split("|")
         if len(parts) >= 2:
             user_id = int(parts[0])
@@ -60,137 +108,143 @@ def parse_authtoken(authtoken: str) -> tuple[int, int]:
 
 def generate_timestamp() -> str:
     """Generate base64 encoded timestamp in the format used by GameSpy."""
+    return _format_timestamp(int(time.time()))
+
+
+@lru_cache(maxsize=1)
+def _format_timestamp(seconds: int) -> str:
+    """Format a Unix time as a GameSpy timestamp; cached since logins often share the same second."""
     # Format: M/d/yyyy h:mm:ss tt (e.g., "1/25/2026 3:30:45 PM")
-    now = datetime.now()
-    hour_12 = now.hour % 12 or 12
-    am_pm = "AM" if now.hour < 12 else "PM"
-    timestamp_str = f"{now.month}/{now.day}/{now.year} {hour_12}:{now.minute:02d}:{now.second:02d} {am_pm}"
+    now = time.localtime(seconds)
+    hour_12 = now.tm_hour % 12 or 12
+    am_pm = "AM" if now.tm_hour < 12 else "PM"
+    timestamp_str = f"{now.tm_mon}/{now.tm_mday}/{now.tm_year} {hour_12}:{now.tm_min:02d}:{now.tm_sec:02d} {am_pm}"
     return base64.b64encode(timestamp_str.encode("utf-8")).decode("utf-8")
 
 
+def handle_login_remote_auth(session: Session, authtoken: str) -> bytes:
+    """
+    Handle LoginRemoteAuth SOAP operation.
+
+    Validates the authtoken against the database and returns a certificate
+    signed over the player's real user/persona data.
+
+    Args:
+        session: Database session for this request.
+        authtoken: The base64 authtoken sent by the game.
+
+    Returns:
+        SOAP envelope bytes with the LoginRemoteAuthResponse certificate, or an error response code.
+    """
+    user_id, profile_id = parse_authtoken(authtoken)
+    logger.debug("Auth: Parsed authtoken -> user_id=%s, profile_id=%s", user_id, profile_id)
+
+    # Validate authtoken parsing succeeded
+    if user_id == 0 or profile_id == 0:
+        logger.warning("Auth: Invalid authtoken - failed to parse user_id/profile_id")
+        return wrap_soap_envelope_bytes(LoginRemoteAuthResponse.error(LoginResponseCode.INVALID_PASSWORD))
+
+    # Get real player info from database and verify user/persona exist
+    user = session.exec(select(User).where(User.id == user_id)).first()
+    if not user:
+        logger.warning("Auth: User not found for user_id=%s", user_id)
+        return wrap_soap_envelope_bytes(LoginRemoteAuthResponse.error(LoginResponseCode.USER_NOT_FOUND))
+
+    # Verify persona exists
+    persona = session.exec(select(Persona).where(Persona.id == profile_id)).first()
+    if not persona:
+        logger.warning("Auth: Persona not found for profile_id=%s", profile_id)
+        return wrap_soap_envelope_bytes(LoginRemoteAuthResponse.error(LoginResponseCode.INVALID_PROFILE))
+
+    # Verify persona belongs to user
+    if persona.user_id != user_id:
+        logger.warning(
+            "Auth: Persona %s does not belong to user %s (actual owner: %s)",
+            profile_id,
+            user_id,
+            persona.user_id,
+        )
+        return wrap_soap_envelope_bytes(LoginRemoteAuthResponse.error(LoginResponseCode.INVALID_PROFILE))
+
+    nickname = persona.name
+    email = user.email
+
+    # Generate or retrieve cached certificate for this profile
+    # We cache by (profile_id, user_id, nickname) to regenerate if player data changes
+    cache_key = profile_id
+    cached_cert = _profile_certificates.get(cache_key)
+
+    if cached_cert is None:
+        logger.info(
+            "Auth: Generating new certificate for profile_id=%s, user_id=%s, nickname=%s",
+            profile_id,
+            user_id,
+            nickname,
+        )
+        cert = generate_certificate_for_player(
+            userid=user_id,
+            profileid=profile_id,
+            profilenick=nickname,
+            uniquenick=nickname,
+        )
+        _profile_certificates[cache_key] = cert
+    else:
+        cert = cached_cert
+        logger.debug("Auth: Using cached certificate for profile_id=%s", profile_id)
+
+    # Generate timestamp
+    timestamp = generate_timestamp()
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Auth: Building response for profile_id=%s, nickname=%s, modulus=%s...",
+            profile_id,
+            nickname,
+            cert.peerkeymodulus[:32],
+        )
+
+    # Build response with real player data and dynamically generated crypto
+    return _LOGIN_SUCCESS_TEMPLATE.render_bytes(
+        {
+            "__USERID__": user_id,
+            "__PROFILEID__": profile_id,
+            "__NICKNAME__": nickname,
+            "__EMAIL__": email,
+            "__PEERKEYMODULUS__": cert.peerkeymodulus,
+            "__SERVERDATA__": cert.serverdata,
+            "__SIGNATURE__": cert.signature,
+            "__TIMESTAMP__": timestamp,
+            "__PEERKEYPRIVATE__": cert.peerkeyprivate,
+        }
+    )
+
+
 @auth_router.post("/AuthService/AuthService.asmx")
-async def auth_handler(request: Request) -> Response:
+async def auth_handler(request: Request, session: Session = Depends(get_db)) -> Response:
     """
     Main handler for Auth Service SOAP requests.
 
-    Routes requests based on SOAPAction header.
+    Routes requests based on SOAPAction header. The synchronous database work
+    of each operation runs in the threadpool so it does not block the event loop.
     """
     try:
         soap_action = request.headers.get("SOAPAction", "").strip('"')
         logger.debug("Auth: SOAPAction=%s", soap_action)
 
         body = await request.body()
-        xml_content = body.decode("utf-8")
-        logger.debug("Auth: Request body=%s", xml_content[:500])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Auth: Request body=%s", body[:500].decode("utf-8", errors="replace"))
 
-        operation = extract_soap_body(xml_content)
+        operation = extract_soap_body(body)
         operation_name = get_operation_name(operation)
         logger.debug("Auth: Operation=%s", operation_name)
 
         if "LoginRemoteAuth" in soap_action or operation_name == "LoginRemoteAuth":
             authtoken = get_element_text(operation, "authtoken")
-            user_id, profile_id = parse_authtoken(authtoken)
-            logger.debug("Auth: Parsed authtoken -> user_id=%s, profile_id=%s", user_id, profile_id)
-
-            # Validate authtoken parsing succeeded
-            if user_id == 0 or profile_id == 0:
-                logger.warning("Auth: Invalid authtoken - failed to parse user_id/profile_id")
-                response_model = LoginRemoteAuthResponse.error(LoginResponseCode.INVALID_PASSWORD)
-                return Response(
-                    content=wrap_soap_envelope(response_model),
-                    media_type="text/xml; charset=utf-8",
-                )
-
-            # Get real player info from database and verify user/persona exist
-            session = create_session()
-            try:
-                # Verify user exists
-                user = session.exec(select(User).where(User.id == user_id)).first()
-                if not user:
-                    logger.warning("Auth: User not found for user_id=%s", user_id)
-                    response_model = LoginRemoteAuthResponse.error(LoginResponseCode.USER_NOT_FOUND)
-                    return Response(
-                        content=wrap_soap_envelope(response_model),
-                        media_type="text/xml; charset=utf-8",
-                    )
-
-                # Verify persona exists
-                persona = session.exec(select(Persona).where(Persona.id == profile_id)).first()
-                if not persona:
-                    logger.warning("Auth: Persona not found for profile_id=%s", profile_id)
-                    response_model = LoginRemoteAuthResponse.error(LoginResponseCode.INVALID_PROFILE)
-                    return Response(
-                        content=wrap_soap_envelope(response_model),
-                        media_type="text/xml; charset=utf-8",
-                    )
-
-                # Verify persona belongs to user
-                if persona.user_id != user_id:
-                    logger.warning(
-                        "Auth: Persona %s does not belong to user %s (actual owner: %s)",
-                        profile_id,
-                        user_id,
-                        persona.user_id,
-                    )
-                    response_model = LoginRemoteAuthResponse.error(LoginResponseCode.INVALID_PROFILE)
-                    return Response(
-                        content=wrap_soap_envelope(response_model),
-                        media_type="text/xml; charset=utf-8",
-                    )
-
-                nickname = persona.name
-                email = user.email
-            finally:
-                session.close()
-
-            # Generate or retrieve cached certificate for this profile
-            # We cache by (profile_id, user_id, nickname) to regenerate if player data changes
-            cache_key = profile_id
-            cached_cert = _profile_certificates.get(cache_key)
-
-            if cached_cert is None:
-                logger.info(
-                    "Auth: Generating new certificate for profile_id=%s, user_id=%s, nickname=%s",
-                    profile_id,
-                    user_id,
-                    nickname,
-                )
-                cert = generate_certificate_for_player(
-                    userid=user_id,
-                    profileid=profile_id,
-                    profilenick=nickname,
-                    uniquenick=nickname,
-                )
-                _profile_certificates[cache_key] = cert
-            else:
-                cert = cached_cert
-                logger.debug("Auth: Using cached certificate for profile_id=%s", profile_id)
-
-            # Generate timestamp
-            timestamp = generate_timestamp()
-
-            logger.debug(
-                "Auth: Building response for profile_id=%s, nickname=%s, modulus=%s...",
-                profile_id,
-                nickname,
-                cert.peerkeymodulus[:32],
-            )
-
-            # Build response with real player data and dynamically generated crypto
-            response_model = LoginRemoteAuthResponse.success(
-                user_id=user_id,
-                profile_id=profile_id,
-                nickname=nickname,
-                email=email,
-                peerkeymodulus=cert.peerkeymodulus,
-                serverdata=cert.serverdata,
-                signature=cert.signature,
-                peerkeyprivate=cert.peerkeyprivate,
-                timestamp=timestamp,
-            )
-            response_xml = wrap_soap_envelope(response_model)
+            response_xml = await run_in_threadpool(handle_login_remote_auth, session, authtoken)
 
-            logger.debug("Auth: Response=%s", response_xml[:500])
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Auth: Response=%s", response_xml[:500].decode("utf-8", errors="replace"))
 
             return Response(
                 content=response_xml,
@@ -198,9 +252,8 @@ async def auth_handler(request: Request) -> Response:
             )
         else:
             # Return generic fault for unknown operations
-            fault_xml = create_soap_fault("Unknown operation")
             return Response(
-                content=fault_xml,
+                content=_UNKNOWN_OPERATION_FAULT,
                 media_type="text/xml; charset=utf-8",
             )
 
@@ -4,10 +4,12 @@ Clan Service - Endpoints for clan functionality.
 These endpoints are called by the game to get clan info for players.
 """
 
+import hashlib
 import os
-from datetime import datetime
+import time
 
-from fastapi import APIRouter, Response
+from fastapi import APIRouter, Request, Response
+from fastapi.concurrency import run_in_threadpool
 
 from app.db.crud import get_clan_by_id, get_persona_clan_membership, get_player_stats, parse_ticket
 from app.db.database import create_session
@@ -16,60 +18,58 @@ from app.util.paths import get_base_path
 
 clan_router = APIRouter()
 
+_RANK_ICON_DIR = os.path.join(get_base_path(), "static", "images")
 
-def format_asof_timestamp() -> str:
-    """Format the current time as the asof timestamp string."""
-    now = datetime.utcnow()
-    return now.strftime("%-m/%-d/%Y %-I:%M:%S %p")
 
+class _CachedPayload:
+    """
+    Constant response body with a stable ETag, answering matching If-None-Match requests with 304.
 
-@clan_router.get("/clans/ClanActions.asmx/ClanInfoByProfileID")
-async def clan_info_by_profile_id(authToken: str = "", profileid: int = 0):
-    """Returns clan info for a profile."""
-    response_model = NotMemberResponse.create()
+    The responses are built once and returned as-is on every request. Starlette only
+    reads a Response when sending it, and FastAPI only fills in its background task
+    when the endpoint declares BackgroundTasks, so sharing them is safe here.
+    """
 
-    if profileid > 0:
-        session = create_session()
-        try:
-            membership = get_persona_clan_membership(session, profileid)
-            if membership and membership.position >= 1:
-                clan = get_clan_by_id(session, membership.clan_id)
-                if clan:
-                    response_model = ClanInfoResponse.for_member(
-                        clan_id=clan.id,
-                        clan_tag=clan.tag,
-                        clan_name=clan.name,
-                        member_id=membership.id,
-                        member_rank=membership.position,
-                        asof=format_asof_timestamp(),
-                    )
-        finally:
-            session.close()
-
-    response_xml = '<?xml version="1.0" encoding="utf-8"?>\n' + response_model.to_xml(encoding="unicode")
-    return Response(content=response_xml, media_type="text/xml; charset=utf-8")
+    def __init__(self, content: bytes, media_type: str, cache_control: str):
+        self.etag = f'"{hashlib.md5(content, usedforsecurity=False).hexdigest()}"'
+        headers = {"Cache-Control": cache_control, "ETag": self.etag}
+        self.response = Response(content=content, media_type=media_type, headers=headers)
+        self.not_modified = Response(status_code=304, headers=headers)
 
+    def for_request(self, request: Request) -> Response:
+        """Return 304 if the client already holds this payload, otherwise the full response."""
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and self._matches(if_none_match):
+            return self.not_modified
+        return self.response
 
-@clan_router.get("/GetPlayerLadderRatings.aspx")
-async def get_player_ladder_ratings(gp: str = ""):
-    """Returns ladder ratings for a player in CSV format."""
-    default_rank = -1
-    elo_1v1 = 1200
+    def _matches(self, if_none_match: str) -> bool:
+        """Check an If-None-Match header value (a list of possibly weak ETags, or *) against the ETag."""
+        if if_none_match.strip() == "*":
+            return True
+        return any(tag.strip().removeprefix("W/") == self.etag for tag in if_none_match.split(","))
 
-    if gp:
-        ticket_data = parse_ticket(gp)
-        if ticket_data:
-            _, persona_id, _ = ticket_data
-            if persona_id > 0:
-                session = create_session()
-                try:
-                    stats = get_player_stats(session, persona_id)
-                    if stats:
-                        elo_1v1 = stats.elo_ranked_1v1
-                finally:
-                    session.close()
-
-    ratings = [
+
+def _load_rank_icon(image_name: str) -> bytes:
+    """Read a rank icon from the static images directory."""
+    with open(os.path.join(_RANK_ICON_DIR, image_name), "rb") as f:
+        return f.read()
+
+
+# Rank icons never change at runtime, so load them once at import and let clients keep them for a day
+_RANK_ICON_CACHE_CONTROL = "public, max-age=86400"
+_LARGE_RANK_ICON = _CachedPayload(_load_rank_icon("rank_icon_large.png"), "image/png", _RANK_ICON_CACHE_CONTROL)
+_SMALL_RANK_ICON = _CachedPayload(_load_rank_icon("rank_icon_small.png"), "image/png", _RANK_ICON_CACHE_CONTROL)
+
+# Clan and ladder stubs change once the player joins a clan or plays a ranked match,
+# so clients must revalidate them; unchanged stubs are answered with 304
+_REVALIDATE_CACHE_CONTROL = "no-cache"
+
+
+# Ladder entries that are the same for every player, followed by the
+# rank/ELO entries that are filled in per request
+_LADDER_FIXED_RATINGS = ",".join(
+    [
         "72587,1,-1,-1",
         "72743,1,-1,-1",
         "75643,1,-1,-1",
@@ -82,24 +82,104 @@ async def get_player_ladder_ratings(gp: str = ""):
         "75684,1,-1,-1",
         "75685,1,-1,-1",
         "75686,1,-1,-1",
-        f"58938,32034,{default_rank},{elo_1v1}",
-        f"58940,1088,{default_rank},{elo_1v1}",
     ]
+)
+DEFAULT_LADDER_RANK = -1
+DEFAULT_LADDER_ELO = 1200
 
-    return Response(content=",".join(ratings) + ",", media_type="text/html")
 
+def build_ladder_ratings_csv(elo_1v1: int, rank: int = DEFAULT_LADDER_RANK) -> bytes:
+    """Build the GetPlayerLadderRatings CSV body for the given 1v1 ELO."""
+    return f"{_LADDER_FIXED_RATINGS},58938,32034,{rank},{elo_1v1},58940,1088,{rank},{elo_1v1},".encode()
 
-@clan_router.get("/GetPlayerRankIcon.aspx")
-async def get_player_rank_icon(gp: str = "", pid: int = 0, size: str = ""):
-    """Returns the rank icon for a player as a PNG image."""
-    image_name = "rank_icon_large.png" if size == "L" else "rank_icon_small.png"
-    image_path = os.path.join(get_base_path(), "static", "images", image_name)
 
-    with open(image_path, "rb") as f:
-        image_data = f.read()
+# Most players (unknown ticket, no stats yet) get the default body
+_DEFAULT_LADDER = _CachedPayload(build_ladder_ratings_csv(DEFAULT_LADDER_ELO), "text/html", _REVALIDATE_CACHE_CONTROL)
+
 
-    return Response(
-        content=image_data,
-        media_type="image/png",
-        headers={"Content-Length": str(len(image_data))},
-    )
+def format_asof_timestamp() -> str:
+    """Format the current time as the asof timestamp string."""
+    # Format: M/d/yyyy h:MM:SS AM/PM in UTC, built directly instead of via strftime
+    now = time.gmtime()
+    hour_12 = now.tm_hour % 12 or 12
+    am_pm = "AM" if now.tm_hour < 12 else "PM"
+    return f"{now.tm_mon}/{now.tm_mday}/{now.tm_year} {hour_12}:{now.tm_min:02d}:{now.tm_sec:02d} {am_pm}"
+
+
+_XML_DECLARATION = '<?xml version="1.0" encoding="utf-8"?>\n'
+
+# Pre-rendered response for players without a clan, the common case
+_NOT_MEMBER = _CachedPayload(
+    (_XML_DECLARATION + NotMemberResponse.create().to_xml(encoding="unicode")).encode("utf-8"),
+    "text/xml; charset=utf-8",
+    _REVALIDATE_CACHE_CONTROL,
+)
+
+
+def render_member_clan_info(profile_id: int) -> bytes | None:
+    """Render the clan info XML for a clan member, or None if the profile is not in a clan."""
+    session = create_session()
+    try:
+        membership = get_persona_clan_membership(session, profile_id)
+        if membership and membership.position >= 1:
+            clan = get_clan_by_id(session, membership.clan_id)
+            if clan:
+                response_model = ClanInfoResponse.for_member(
+                    clan_id=clan.id,
+                    clan_tag=clan.tag,
+                    clan_name=clan.name,
+                    member_id=membership.id,
+                    member_rank=membership.position,
+                    asof=format_asof_timestamp(),
+                )
+                return (_XML_DECLARATION + response_model.to_xml(encoding="unicode")).encode("utf-8")
+        return None
+    finally:
+        session.close()
+
+
+def get_ranked_1v1_elo(persona_id: int) -> int:
+    """Get a persona's ranked 1v1 ELO, or the default if they have no stats yet."""
+    session = create_session()
+    try:
+        stats = get_player_stats(session, persona_id)
+        return stats.elo_ranked_1v1 if stats else DEFAULT_LADDER_ELO
+    finally:
+        session.close()
+
+
+@clan_router.get("/clans/ClanActions.asmx/ClanInfoByProfileID")
+async def clan_info_by_profile_id(request: Request, authToken: str = "", profileid: int = 0):
+    """Returns clan info for a profile."""
+    # Only real profiles are looked up, in the threadpool; the not-member stub does no DB work
+    if profileid > 0:
+        response_xml = await run_in_threadpool(render_member_clan_info, profileid)
+        if response_xml is not None:
+            return Response(content=response_xml, media_type="text/xml; charset=utf-8")
+
+    return _NOT_MEMBER.for_request(request)
+
+
+@clan_router.get("/GetPlayerLadderRatings.aspx")
+async def get_player_ladder_ratings(request: Request, gp: str = ""):
+    """Returns ladder ratings for a player in CSV format."""
+    elo_1v1 = DEFAULT_LADDER_ELO
+
+    if gp:
+        ticket_data = parse_ticket(gp)
+        if ticket_data:
+            _, persona_id, _ = ticket_data
+            if persona_id > 0:
+                elo_1v1 = await run_in_threadpool(get_ranked_1v1_elo, persona_id)
+
+    if elo_1v1 == DEFAULT_LADDER_ELO:
+        return _DEFAULT_LADDER.for_request(request)
+
+    return Response(content=build_ladder_ratings_csv(elo_1v1), media_type="text/html")
+
+
+@clan_router.get("/GetPlayerRankIcon.aspx")
+async def get_player_rank_icon(request: Request, gp: str = "", pid: int = 0, size: str = ""):
+    """Returns the rank icon for a player as a PNG image."""
+    icon = _LARGE_RANK_ICON if size == "L" else _SMALL_RANK_ICON
+    return icon.for_request(request)
@@ -11,36 +11,40 @@ This service handles:
 The game uses this service to track match results for ranked games.
 """
 
-import gzip
-import json
+import logging
 import os
+import re
 import uuid
+import zlib
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime
 
-from fastapi import APIRouter, Request, Response
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from lxml import etree
+from sqlmodel import Session
 
+from app.config.app_settings import app_config
 from app.db.crud import (
-    complete_competition_session,
     create_competition_session,
     extract_persona_from_ccid,
     finalize_match,
     get_match_reports_for_session,
-    increment_received_reports,
-    mark_report_intent_reported,
     set_report_intention,
-    submit_match_report,
+    submit_and_complete,
 )
-from app.db.database import create_session
-from app.models.match_report import MatchReport
+from app.db.database import session_scope
+from app.db.report_batcher import report_batcher
+from app.models.match_report import REPORT_HEADER, MatchPlayer, MatchReport, MatchReportData
 from app.soap.envelope import (
+    SoapTemplate,
     create_soap_fault,
-    extract_soap_body,
-    get_child_element,
-    get_element_text,
-    get_operation_name,
-    wrap_soap_envelope,
+    wrap_soap_envelope_bytes,
 )
 from app.soap.models.competition import (
+    CompetitionResultCode,
     CreateSessionResponse,
     SetReportIntentionResponse,
     SubmitReportResponse,
@@ -55,68 +59,158 @@ competition_router = APIRouter()
 COMP_NS = "http://gamespy.net/competition/"
 
 
-def extract_profile_id_from_certificate(operation: any) -> int:
+class _OperationFieldsTarget:
     """
-    Extract profileid from the certificate element in the operation.
+    lxml parser target collecting the fields read from a competition request.
 
-    The game sends profileid inside a nested certificate element:
+    The game sends csid and ccid directly in the operation element and the
+    profileid inside a nested certificate element:
     <SetReportIntention>
         <certificate>
             <profileid>12345</profileid>
             ...
         </certificate>
-        ...
+        <csid>...</csid>
+        <ccid>...</ccid>
     </SetReportIntention>
 
+    Only these values are kept while the body is parsed, so no element tree
+    is built for the request.
+    """
+
+    # Field paths below the operation element, mapped to their field name
+    _FIELD_PATHS = {("csid",): "csid", ("ccid",): "ccid", ("certificate", "profileid"): "profileid"}
+
+    def __init__(self):
+        self._path: list[str] = []
+        self._field: str | None = None
+        self._text: list[str] = []
+        self.operation = ""
+        self.fields: dict[str, str] = {}
+
+    def start(self, tag: str, attrib: dict) -> None:
+        self._path.append(tag[tag.rfind("}") + 1 :])
+        depth = len(self._path)
+        if depth == 3 and not self.operation and self._path[1] == "Body":
+            self.operation = self._path[2]
+        elif depth > 3 and self._path[2] == self.operation and self._path[1] == "Body":
+            field = self._FIELD_PATHS.get(tuple(self._path[3:]))
+            if field is not None and field not in self.fields:
+                self._field = field
+                self._text = []
+
+    def data(self, data: str) -> None:
+        if self._field is not None:
+            self._text.append(data)
+
+    def end(self, tag: str) -> None:
+        if self._field is not None:
+            self.fields[self._field] = "".join(self._text)
+            self._field = None
+        self._path.pop()
+
+    def close(self) -> "_OperationFieldsTarget":
+        return self
+
+
+# Chunk size for feeding a bytearray body to the XML parser
+_PARSER_FEED_SIZE = 65536
+
+
+def parse_operation_fields(body: bytes | bytearray) -> tuple[str, dict[str, str]]:
+    """
+    Parse a competition SOAP request in a single streaming pass.
+
     Args:
-        operation: The parsed XML operation element.
+        body: Raw request body bytes, or the bytearray of a decompressed body.
 
     Returns:
-        The profile ID, or 0 if not found.
+        Tuple of (operation name, fields), where fields holds whichever of
+        csid, ccid and profileid the request carries.
+
+    Raises:
+        ValueError: If the SOAP operation is not found in the Body.
     """
-    cert_element = get_child_element(operation, "certificate")
-    if cert_element is not None:
-        profile_id_str = get_element_text(cert_element, "profileid")
-        if profile_id_str:
-            return int(profile_id_str)
-    return 0
+    # Parser targets keep per-parse state, so each request gets its own parser
+    parser = etree.XMLParser(target=_OperationFieldsTarget(), resolve_entities=False, no_network=True)
+    if isinstance(body, bytes):
+        parser.feed(body)
+    else:
+        # lxml only accepts bytes, so feed a bytearray in chunks instead of copying it whole
+        view = memoryview(body)
+        for start in range(0, len(view), _PARSER_FEED_SIZE):
+            parser.feed(view[start : start + _PARSER_FEED_SIZE].tobytes())
+    target = parser.close()
+    if not target.operation:
+        raise ValueError("SOAP operation not found in Body")
+    return target.operation, target.fields
+
+
+def _profile_id_field(fields: dict[str, str]) -> int:
+    """Get the certificate profile ID from the parsed fields, or 0 if not sent."""
+    profile_id = fields.get("profileid")
+    return int(profile_id) if profile_id else 0
 
 
 # Directory to save match reports
 REPORT_DIR = os.path.join(os.getcwd(), "Report")
 
+# Report files saved per submission: "none", "raw" (.bin only) or "both" (.bin and parsed .json)
+REPORT_DUMP_MODE = app_config.reports.dump_mode
+
+# Set once REPORT_DIR has been created, so later saves skip the makedirs call
+_REPORT_DIR_READY = False
+
+
+def _open_report_file(path: str):
+    """Open a report file for binary writing, creating REPORT_DIR on first use or if it was removed."""
+    global _REPORT_DIR_READY
+    if not _REPORT_DIR_READY:
+        os.makedirs(REPORT_DIR, exist_ok=True)
+        _REPORT_DIR_READY = True
+    try:
+        return open(path, "wb")
+    except FileNotFoundError:
+        os.makedirs(REPORT_DIR, exist_ok=True)
+        return open(path, "wb")
+
 
-def save_match_report(csid: str, ccid: str, raw_report: bytes, report: MatchReport | None) -> None:
+def save_match_report(
+    csid: str,
+    ccid: str,
+    raw_report: bytes | memoryview,
+    report: MatchReport | None,
+    player_list: list[MatchPlayer],
+) -> None:
     """
-    Save match report to files (binary and parsed JSON).
+    Save match report to files (binary, plus parsed JSON when REPORT_DUMP_MODE is "both").
 
     Args:
         csid: Competition Session ID (match ID).
         ccid: Competition Channel ID (player ID).
         raw_report: Raw binary report data.
         report: Parsed MatchReport object, or None if parsing failed.
+        player_list: Players of the parsed report, as already built by handle_submit_report.
     """
     try:
-        os.makedirs(REPORT_DIR, exist_ok=True)
-
         # Generate timestamp for unique filenames
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
 
         # Use ccid if available, otherwise use profileid placeholder
         player_id = ccid if ccid else "unknown"
 
+        # csid and ccid are server-generated, so they are safe to use in file names
+        base_path = f"{REPORT_DIR}{os.sep}Report_{csid}_{player_id}_{timestamp}"
+
         # Save raw binary report
-        bin_filename = f"Report_{csid}_{player_id}_{timestamp}.bin"
-        bin_path = os.path.join(REPORT_DIR, bin_filename)
-        with open(bin_path, "wb") as f:
+        bin_path = base_path + ".bin"
+        with _open_report_file(bin_path) as f:
             f.write(raw_report)
         logger.info("Saved raw report to %s (%d bytes)", bin_path, len(raw_report))
 
         # Save parsed report as JSON
-        if report:
-            json_filename = f"Report_{csid}_{player_id}_{timestamp}.json"
-            json_path = os.path.join(REPORT_DIR, json_filename)
-            player_list = report.get_player_list()
+        if report and REPORT_DUMP_MODE == "both":
+            json_path = base_path + ".json"
             # Convert team_section DataValue objects to JSON-serializable format
             team_section_json = [
                 {str(k): {"type": v.value_type.name, "value": v.value} for k, v in team.items()}
@@ -156,21 +250,24 @@ def save_match_report(csid: str, ccid: str, raw_report: bytes, report: MatchRepo
                 "winner_ids": report.get_winner_id_list(),
                 "loser_ids": report.get_loser_id_list(),
             }
-            with open(json_path, "w") as f:
-                json.dump(report_dict, f, indent=2)
+            # Serialize first so the file is written with a single write call
+            report_json = orjson.dumps(report_dict, option=orjson.OPT_INDENT_2)
+            with _open_report_file(json_path) as f:
+                f.write(report_json)
             logger.info("Saved parsed report to %s", json_path)
 
     except Exception as e:
         logger.warning("Error saving report: %s", e)
 
 
-def handle_create_session(profile_id: int) -> CreateSessionResponse:
+def handle_create_session(session: Session, profile_id: int) -> CreateSessionResponse:
     """
     Handle CreateSession SOAP operation.
 
     Creates a new match session and returns csid and ccid.
 
     Args:
+        session: Database session for this request.
         profile_id: The profile ID creating the session.
 
     Returns:
@@ -178,23 +275,19 @@ def handle_create_session(profile_id: int) -> CreateSessionResponse:
     """
     logger.debug("Competition CreateSession: profileId=%s", profile_id)
 
-    session = create_session()
-    try:
-        comp_session = create_competition_session(session, profile_id)
-        logger.debug(
-            "Competition: Created session csid=%s, ccid=%s",
-            comp_session.csid,
-            comp_session.ccid,
-        )
-        return CreateSessionResponse.success(
-            csid=comp_session.csid,
-            ccid=comp_session.ccid,
-        )
-    finally:
-        session.close()
+    comp_session = create_competition_session(session, profile_id)
+    logger.debug(
+        "Competition: Created session csid=%s, ccid=%s",
+        comp_session.csid,
+        comp_session.ccid,
+    )
+    return CreateSessionResponse.success(
+        csid=comp_session.csid,
+        ccid=comp_session.ccid,
+    )
 
 
-def handle_set_report_intention(csid: str, ccid: str, profile_id: int) -> SetReportIntentionResponse:
+def handle_set_report_intention(session: Session, csid: str, ccid: str, profile_id: int) -> SetReportIntentionResponse:
     """
     Handle SetReportIntention SOAP operation.
 
@@ -202,6 +295,7 @@ def handle_set_report_intention(csid: str, ccid: str, profile_id: int) -> SetRep
     Creates a PlayerReportIntent record and generates a unique ccid for this player.
 
     Args:
+        session: Database session for this request.
         csid: Competition Session ID.
         ccid: Competition Channel ID (from request).
         profile_id: The profile ID setting the intention.
@@ -216,32 +310,50 @@ def handle_set_report_intention(csid: str, ccid: str, profile_id: int) -> SetRep
         profile_id,
     )
 
-    session = create_session()
-    try:
-        intent = set_report_intention(session, csid, ccid, profile_id)
-        if intent:
-            logger.info(
-                "Competition: Created report intent for persona=%d, assigned ccid=%s",
-                profile_id,
-                intent.ccid,
-            )
-            return SetReportIntentionResponse.success(csid=csid, ccid=intent.ccid)
-        else:
-            logger.warning("Competition: Failed to create report intent for csid=%s", csid)
-            return SetReportIntentionResponse.error()
-    finally:
-        session.close()
+    intent = set_report_intention(session, csid, ccid, profile_id)
+    if intent:
+        logger.info(
+            "Competition: Created report intent for persona=%d, assigned ccid=%s",
+            profile_id,
+            intent.ccid,
+        )
+        return SetReportIntentionResponse.success(csid=csid, ccid=intent.ccid)
+    else:
+        logger.warning("Competition: Failed to create report intent for csid=%s", csid)
+        return SetReportIntentionResponse.error()
+
+
+@dataclass(slots=True)
+class SubmittedReport:
+    """A parsed SubmitReport waiting to be stored by store_submitted_report."""
+
+    csid: str
+    ccid: str
+    profile_id: int
+    report_data: MatchReportData
+    request_id: str
+    full_id: str = ""
+    is_final_report: bool = False
+    # Set for final reports where the submitter's result must be determined by
+    # elimination against the reports already stored for the session
+    elimination_players: list[MatchPlayer] | None = None
 
 
 def handle_submit_report(
-    csid: str, ccid: str, profile_id: int, raw_report: bytes, request_id: str
-) -> SubmitReportResponse:
+    csid: str,
+    ccid: str,
+    profile_id: int,
+    raw_report: bytes | memoryview,
+    request_id: str,
+    background_tasks: BackgroundTasks,
+) -> SubmittedReport:
     """
     Handle SubmitReport SOAP operation.
 
-    Submits match report data (raw binary). Parses the report using MatchReport,
-    saves both raw and parsed data to files, and stores results in the database.
-    When the final report is received, triggers match finalization with ELO updates.
+    Submits match report data (raw binary). Parses the report using MatchReport
+    and, depending on REPORT_DUMP_MODE, schedules saving the raw and parsed data
+    to files once the response has been sent. The returned SubmittedReport is
+    stored in the database by store_submitted_report.
 
     Args:
         csid: Competition Session ID.
@@ -249,9 +361,10 @@ def handle_submit_report(
         profile_id: The profile ID submitting the report.
         raw_report: Raw binary report data.
         request_id: Unique request ID for logging.
+        background_tasks: Request background tasks, used for the report file writes.
 
     Returns:
-        SubmitReportResponse indicating success or error.
+        SubmittedReport with the data to store.
     """
     logger.info(
         "[%s] === SUBMIT REPORT START === csid=%s, ccid=%s, profileId=%d, report_size=%d",
@@ -263,193 +376,248 @@ def handle_submit_report(
     )
 
     report: MatchReport | None = None
-    report_data: dict = {}
+    player_list: list[MatchPlayer] = []
+    report_data: MatchReportData = {}
     is_final_report = False
     player_full_id = ""
+    elimination_players: list[MatchPlayer] | None = None
 
     # Parse the binary report
     if raw_report:
-        try:
-            report = MatchReport.from_bytes(raw_report)
-
-            # Extract useful data for database storage
-            player_list = report.get_player_list()
-
-            # Extract persona_id from ccid (this is reliable, we embedded it)
-            ccid_persona_id = extract_persona_from_ccid(ccid) if ccid else None
-            if ccid_persona_id:
-                logger.info("[%s] Extracted persona_id=%d from ccid", request_id, ccid_persona_id)
-                # Use ccid persona_id instead of SOAP profile_id for reliability
-                profile_id = ccid_persona_id
-
-            # Find this player's data in the report
-            player_result = 0
-            player_faction = ""
-            player_found = False
-
-            # First try to match by persona_id
-            for player in player_list:
-                if player.persona_id == profile_id:
-                    player_result = 0 if player.is_winner else 1
-                    player_faction = player.faction
-                    player_full_id = player.full_id
-                    player_found = True
-                    break
-
-            # If not found by persona_id, determine result from report structure
-            if not player_found:
-                if len(player_list) == 1:
-                    # Partial report: the single player IS the submitter
-                    player = player_list[0]
-                    player_result = 0 if player.is_winner else 1
-                    player_faction = player.faction
-                    player_full_id = player.full_id
-                    player_found = True
-                    logger.info(
-                        "[%s] Used partial report player data (persona_id mismatch: profile=%d vs parsed=%d)",
-                        request_id,
-                        profile_id,
-                        player.persona_id,
-                    )
-                elif len(player_list) == 2:
-                    # Final report: determine result by elimination
-                    # Check if another player already reported for this session
-                    db_session = create_session()
-                    try:
-                        existing_reports = get_match_reports_for_session(db_session, csid)
-                        if existing_reports:
-                            # Another player already reported - we're the opposite result
-                            other_result = existing_reports[0].result
-                            player_result = 0 if other_result == 1 else 1  # Opposite
-                            player_found = True
-                            logger.info(
-                                "[%s] Final report: determined result by elimination (other_result=%d, our_result=%d)",
-                                request_id,
-                                other_result,
-                                player_result,
-                            )
-                            # Use faction from winner if we won, loser if we lost
-                            for player in player_list:
-                                if (player_result == 0 and player.is_winner) or (
-                                    player_result == 1 and not player.is_winner
-                                ):
-                                    player_faction = player.faction
-                                    player_full_id = player.full_id
-                                    break
-                        else:
-                            # We're first to report with final report
-                            # Use is_winner from binary as fallback (winner position in report)
-                            for player in player_list:
-                                if player.is_winner:
-                                    player_result = 0  # Win
-                                    player_faction = player.faction
-                                    player_full_id = player.full_id
-                                    player_found = True
-                                    logger.info(
-                                        "[%s] Final report (first): using is_winner from binary (persona_id=%d)",
-                                        request_id,
-                                        profile_id,
-                                    )
-                                    break
-                    finally:
-                        db_session.close()
-
-            # Map game type string to int
-            # Valid1v1/AutoMatch1v1 -> 1, Valid2v2/AutoMatch2v2 -> 2
-            # Clan1v1 -> 3, Clan2v2 -> 4
-            # ValidOther -> 0 (unranked/custom)
-            game_type_str = report.get_game_type()
-            gametype_int = 0  # Default unranked
-            if "Clan1v1" in game_type_str:
-                gametype_int = 3  # clan_1v1
-            elif "Clan2v2" in game_type_str:
-                gametype_int = 4  # clan_2v2
-            elif "1v1" in game_type_str:
-                gametype_int = 1  # ranked_1v1
-            elif "2v2" in game_type_str:
-                gametype_int = 2  # ranked_2v2
-
-            report_data = {
-                "result": player_result,
-                "faction": player_faction,
-                "duration": report.get_duration(),
-                "gametype": gametype_int,
-                "map_name": report.get_map_path(),
-            }
-
-            # Determine if this is a partial or final report
-            # Final reports have more than 1 player
-            is_final_report = len(player_list) > 1
-
-            logger.info(
-                "[%s] Report parsed successfully - protocol_version=%d, developer_version=%d",
-                request_id,
-                report.protocol_version,
-                report.developer_version,
-            )
-            logger.info(
-                "[%s] Report type: %s (player_count=%d)",
-                request_id,
-                "FINAL REPORT" if is_final_report else "PARTIAL REPORT",
-                len(player_list),
-            )
-            logger.info(
-                "[%s] Game info - game_type=%s, map=%s, replay_guid=%s, is_auto_match=%s",
-                request_id,
-                game_type_str,
-                report.get_map_path(),
-                report.get_replay_guid(),
-                report.is_auto_match,
-            )
-            logger.info(
-                "[%s] Player data - result=%d, faction=%s, gametype=%d",
+        if len(raw_report) < REPORT_HEADER.size:
+            # Too short to hold the fixed header, nothing to parse
+            logger.warning(
+                "[%s] Report too short to parse (%d bytes, header is %d bytes)",
                 request_id,
-                player_result,
-                player_faction,
-                gametype_int,
+                len(raw_report),
+                REPORT_HEADER.size,
             )
+        else:
+            try:
+                report = MatchReport.from_bytes(raw_report)
+
+                # Extract useful data for database storage
+                player_list = report.get_player_list()
+
+                # Extract persona_id from ccid (this is reliable, we embedded it)
+                ccid_persona_id = extract_persona_from_ccid(ccid) if ccid else None
+                if ccid_persona_id:
+                    logger.info("[%s] Extracted persona_id=%d from ccid", request_id, ccid_persona_id)
+                    # Use ccid persona_id instead of SOAP profile_id for reliability
+                    profile_id = ccid_persona_id
+
+                # Find this player's data in the report
+                player_result = 0
+                player_faction = ""
+                player_found = False
+
+                # First try to match by persona_id
+                for player in player_list:
+                    if player.persona_id == profile_id:
+                        player_result = 0 if player.is_winner else 1
+                        player_faction = player.faction
+                        player_full_id = player.full_id
+                        player_found = True
+                        break
+
+                # If not found by persona_id, determine result from report structure
+                if not player_found:
+                    if len(player_list) == 1:
+                        # Partial report: the single player IS the submitter
+                        player = player_list[0]
+                        player_result = 0 if player.is_winner else 1
+                        player_faction = player.faction
+                        player_full_id = player.full_id
+                        player_found = True
+                        logger.info(
+                            "[%s] Used partial report player data (persona_id mismatch: profile=%d vs parsed=%d)",
+                            request_id,
+                            profile_id,
+                            player.persona_id,
+                        )
+                    elif len(player_list) == 2:
+                        # Final report: determine result by elimination against the
+                        # reports already stored, which happens when storing it
+                        elimination_players = player_list
+
+                # Map game type string to int
+                # Valid1v1/AutoMatch1v1 -> 1, Valid2v2/AutoMatch2v2 -> 2
+                # Clan1v1 -> 3, Clan2v2 -> 4
+                # ValidOther -> 0 (unranked/custom)
+                game_type_str = report.get_game_type()
+                gametype_int = 0  # Default unranked
+                if "Clan1v1" in game_type_str:
+                    gametype_int = 3  # clan_1v1
+                elif "Clan2v2" in game_type_str:
+                    gametype_int = 4  # clan_2v2
+                elif "1v1" in game_type_str:
+                    gametype_int = 1  # ranked_1v1
+                elif "2v2" in game_type_str:
+                    gametype_int = 2  # ranked_2v2
+
+                report_data = {
+                    "result": player_result,
+                    "faction": player_faction,
+                    "duration": report.get_duration(),
+                    "gametype": gametype_int,
+                    "map_name": report.get_map_path(),
+                }
+
+                # Determine if this is a partial or final report
+                # Final reports have more than 1 player
+                is_final_report = len(player_list) > 1
 
-            # Log each player's result
-            for idx, player in enumerate(player_list):
                 logger.info(
-                    "[%s] Player %d/%d: persona_id=%d, full_id=%s, faction=%s, is_winner=%s",
+                    "[%s] Report parsed successfully - protocol_version=%d, developer_version=%d",
                     request_id,
-                    idx + 1,
+                    report.protocol_version,
+                    report.developer_version,
+                )
+                logger.info(
+                    "[%s] Report type: %s (player_count=%d)",
+                    request_id,
+                    "FINAL REPORT" if is_final_report else "PARTIAL REPORT",
                     len(player_list),
-                    player.persona_id,
-                    player.full_id,
-                    player.faction,
-                    player.is_winner,
                 )
+                logger.info(
+                    "[%s] Game info - game_type=%s, map=%s, replay_guid=%s, is_auto_match=%s",
+                    request_id,
+                    game_type_str,
+                    report.get_map_path(),
+                    report.get_replay_guid(),
+                    report.is_auto_match,
+                )
+                # Log every player's result in one line (persona_id:full_id:faction:is_winner)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "[%s] Players: %s",
+                        request_id,
+                        ";".join(f"{p.persona_id}:{p.full_id}:{p.faction}:{int(p.is_winner)}" for p in player_list),
+                    )
 
-            if is_final_report:
-                logger.info("[%s] Winners: %s", request_id, report.get_winner_id_list())
-                logger.info("[%s] Losers: %s", request_id, report.get_loser_id_list())
+                if is_final_report:
+                    logger.info("[%s] Winners: %s", request_id, report.get_winner_id_list())
+                    logger.info("[%s] Losers: %s", request_id, report.get_loser_id_list())
 
-        except Exception as e:
-            logger.exception("[%s] Error parsing report: %s", request_id, e)
+            except Exception as e:
+                logger.exception("[%s] Error parsing report: %s", request_id, e)
 
-        # Save report to files
-        save_match_report(csid, ccid, raw_report, report)
+        # Save report to files after the response is sent, unless dumping is disabled
+        if REPORT_DUMP_MODE != "none":
+            background_tasks.add_task(save_match_report, csid, ccid, raw_report, report, player_list)
     else:
         logger.warning("[%s] No report data received!", request_id)
 
+    return SubmittedReport(
+        csid=csid,
+        ccid=ccid,
+        profile_id=profile_id,
+        report_data=report_data,
+        request_id=request_id,
+        full_id=player_full_id,
+        is_final_report=is_final_report,
+        elimination_players=elimination_players,
+    )
+
+
+def _resolve_result_by_elimination(session: Session, submitted: SubmittedReport) -> None:
+    """
+    Determine a final report's result from the reports already stored for the session.
+
+    Updates the submitted report's result, faction and full_id in place.
+    """
+    request_id = submitted.request_id
+    player_result = 0
+    player_faction = ""
+    player_full_id = ""
+
+    # Check if another player already reported for this session
+    existing_reports = get_match_reports_for_session(session, submitted.csid)
+    if existing_reports:
+        # Another player already reported - we're the opposite result
+        other_result = existing_reports[0].result
+        player_result = 0 if other_result == 1 else 1  # Opposite
+        logger.info(
+            "[%s] Final report: determined result by elimination (other_result=%d, our_result=%d)",
+            request_id,
+            other_result,
+            player_result,
+        )
+        # Use faction from winner if we won, loser if we lost
+        for player in submitted.elimination_players:
+            if (player_result == 0 and player.is_winner) or (player_result == 1 and not player.is_winner):
+                player_faction = player.faction
+                player_full_id = player.full_id
+                break
+    else:
+        # We're first to report with final report
+        # Use is_winner from binary as fallback (winner position in report)
+        for player in submitted.elimination_players:
+            if player.is_winner:
+                player_result = 0  # Win
+                player_faction = player.faction
+                player_full_id = player.full_id
+                logger.info(
+                    "[%s] Final report (first): using is_winner from binary (persona_id=%d)",
+                    request_id,
+                    submitted.profile_id,
+                )
+                break
+
+    submitted.report_data["result"] = player_result
+    submitted.report_data["faction"] = player_faction
+    submitted.full_id = player_full_id
+
+
+def store_submitted_report(session: Session, submitted: SubmittedReport) -> SubmitReportResponse:
+    """
+    Store a parsed SubmitReport in the database.
+
+    Runs inside a report_batcher batch: changes are flushed to the batch's session
+    and committed together with the other reports in the batch. When the final
+    report is received, triggers match finalization with ELO updates.
+
+    Args:
+        session: Database session of the batch.
+        submitted: The parsed report from handle_submit_report.
+
+    Returns:
+        SubmitReportResponse indicating success.
+    """
+    request_id = submitted.request_id
+    csid = submitted.csid
+
+    report_data = submitted.report_data
+    if submitted.elimination_players and report_data:
+        _resolve_result_by_elimination(session, submitted)
+    if report_data:
+        # Logged here as a final report's result and faction are only known after elimination
+        logger.info(
+            "[%s] Player data - result=%d, faction=%s, gametype=%d",
+            request_id,
+            report_data["result"],
+            report_data["faction"],
+            report_data["gametype"],
+        )
+
     # Store in database
     logger.info("[%s] Storing report in database...", request_id)
-    session = create_session()
     try:
-        # Store the match report
-        submit_match_report(session, csid, ccid, profile_id, report_data)
-
-        # Mark report intent as reported and update full_id
-        if ccid:
-            mark_report_intent_reported(session, ccid, player_full_id)
-
-        # Increment received reports counter
-        comp_session = increment_received_reports(session, csid)
+        # Store the match report, mark the report intent as reported (updating full_id)
+        # and increment the received reports counter.
+        # Non-final reports also mark the session completed in the same transaction.
+        comp_session = submit_and_complete(
+            session,
+            csid,
+            submitted.ccid,
+            submitted.profile_id,
+            submitted.report_data,
+            full_id=submitted.full_id,
+            complete=not submitted.is_final_report,
+        )
 
         # Check if this is the final report (all players have reported)
-        if is_final_report and comp_session:
+        if submitted.is_final_report and comp_session:
             logger.info(
                 "[%s] Final report received, finalizing match (received=%d, expected=%d)",
                 request_id,
@@ -460,20 +628,65 @@ def handle_submit_report(
                 logger.info("[%s] Match finalized successfully with ELO updates", request_id)
             else:
                 logger.warning("[%s] Match finalization returned False", request_id)
-        else:
-            # Just mark as completed if not final
-            complete_competition_session(session, csid)
 
         logger.info("[%s] === SUBMIT REPORT END === Success", request_id)
         return SubmitReportResponse.success()
     except Exception as e:
         logger.exception("[%s] === SUBMIT REPORT END === Database error: %s", request_id, e)
         raise
-    finally:
-        session.close()
 
 
-def extract_submit_report_data(body: bytes, request_id: str) -> tuple[str, str, int, bytes]:
+# Marker preceding the binary report in a SubmitReport body
+_BIN_MARKER = b"application/bin\x00"
+_BIN_MARKER_LEN = len(_BIN_MARKER)
+
+# XML fields read from a SubmitReport body: (name, start marker, end marker, start marker length)
+_SUBMIT_REPORT_FIELDS = tuple(
+    (name, f"<gsc:{name}>".encode(), f"</gsc:{name}>".encode(), len(f"<gsc:{name}>"))
+    for name in ("csid", "ccid", "userid", "profileid", "authoritative")
+)
+
+
+# All SubmitReport fields with plain text values, matched in a single scan
+_SUBMIT_REPORT_FIELD_RE = re.compile(
+    rb"<gsc:(" + b"|".join(name.encode() for name, _, _, _ in _SUBMIT_REPORT_FIELDS) + rb")>([^<]*)</gsc:\1>"
+)
+
+
+def _find_marked_fields(body: bytes | bytearray, limit: int) -> dict[str, bytes]:
+    """Find the raw value of each SubmitReport XML field present in body[:limit]."""
+    fields = {}
+    for match in _SUBMIT_REPORT_FIELD_RE.finditer(body, 0, limit):
+        fields.setdefault(match.group(1).decode("ascii"), match.group(2))
+        if len(fields) == len(_SUBMIT_REPORT_FIELDS):
+            return fields
+
+    # Fall back to marker searches for fields the scan missed (absent, or not plain text)
+    for name, marker, end_marker, marker_len in _SUBMIT_REPORT_FIELDS:
+        if name in fields:
+            continue
+        start = body.find(marker, 0, limit)
+        if start == -1:
+            continue
+        start += marker_len
+        end = body.find(end_marker, start, limit)
+        if end != -1:
+            fields[name] = body[start:end]
+    return fields
+
+
+def _parse_int_field(value: bytes | None) -> int:
+    """Parse an integer field value, returning 0 when it is missing or invalid."""
+    if value is None:
+        return 0
+    try:
+        # int() parses ASCII digits from bytes directly, no decode needed
+        return int(value)
+    except ValueError:
+        return 0
+
+
+def extract_submit_report_data(body: bytes | bytearray, request_id: str) -> tuple[str, str, int, memoryview]:
     """
     Extract data from SubmitReport request.
 
@@ -482,6 +695,10 @@ def extract_submit_report_data(body: bytes, request_id: str) -> tuple[str, str,
     - Marker: "application/bin\0"
     - Raw binary report data
 
+    The binary marker is located first so the XML field searches never scan
+    the binary payload, and the report is returned as a view into the body
+    instead of a copy.
+
     Args:
         body: Raw request body bytes.
         request_id: Unique request ID for logging.
@@ -491,80 +708,21 @@ def extract_submit_report_data(body: bytes, request_id: str) -> tuple[str, str,
     """
     logger.info("[%s] Extracting SubmitReport data from body (size=%d bytes)", request_id, len(body))
 
-    # Markers to find in the raw bytes
-    csid_marker = b"<gsc:csid>"
-    csid_end_marker = b"</gsc:csid>"
-    ccid_marker = b"<gsc:ccid>"
-    ccid_end_marker = b"</gsc:ccid>"
-    profileid_marker = b"<gsc:profileid>"
-    profileid_end_marker = b"</gsc:profileid>"
-    userid_marker = b"<gsc:userid>"
-    userid_end_marker = b"</gsc:userid>"
-    authoritative_marker = b"<gsc:authoritative>"
-    authoritative_end_marker = b"</gsc:authoritative>"
-    bin_marker = b"application/bin\x00"
-
-    # Extract csid
-    csid = ""
-    csid_start = body.find(csid_marker)
-    if csid_start != -1:
-        csid_start += len(csid_marker)
-        csid_end = body.find(csid_end_marker, csid_start)
-        if csid_end != -1:
-            csid = body[csid_start:csid_end].decode("ascii", errors="ignore")
-    logger.info("[%s] Extracted csid=%s", request_id, csid)
-
-    # Extract ccid
-    ccid = ""
-    ccid_start = body.find(ccid_marker)
-    if ccid_start != -1:
-        ccid_start += len(ccid_marker)
-        ccid_end = body.find(ccid_end_marker, ccid_start)
-        if ccid_end != -1:
-            ccid = body[ccid_start:ccid_end].decode("ascii", errors="ignore")
-    logger.info("[%s] Extracted ccid=%s", request_id, ccid)
-
-    # Extract userid from certificate
-    user_id = 0
-    userid_start = body.find(userid_marker)
-    if userid_start != -1:
-        userid_start += len(userid_marker)
-        userid_end = body.find(userid_end_marker, userid_start)
-        if userid_end != -1:
-            try:
-                user_id = int(body[userid_start:userid_end].decode("ascii"))
-            except ValueError:
-                pass
-    logger.info("[%s] Extracted userId=%d", request_id, user_id)
-
-    # Extract profileid from certificate
-    profile_id = 0
-    profileid_start = body.find(profileid_marker)
-    if profileid_start != -1:
-        profileid_start += len(profileid_marker)
-        profileid_end = body.find(profileid_end_marker, profileid_start)
-        if profileid_end != -1:
-            try:
-                profile_id = int(body[profileid_start:profileid_end].decode("ascii"))
-            except ValueError:
-                pass
-    logger.info("[%s] Extracted profileId=%d", request_id, profile_id)
-
-    # Extract authoritative flag
-    authoritative = ""
-    auth_start = body.find(authoritative_marker)
-    if auth_start != -1:
-        auth_start += len(authoritative_marker)
-        auth_end = body.find(authoritative_end_marker, auth_start)
-        if auth_end != -1:
-            authoritative = body[auth_start:auth_end].decode("ascii", errors="ignore")
-    logger.info("[%s] Extracted authoritative=%s", request_id, authoritative)
-
-    # Extract binary report (after "application/bin\0" marker)
-    raw_report = b""
-    bin_pos = body.find(bin_marker)
+    # Locate the binary report (after "application/bin\0" marker); XML fields are before it
+    bin_pos = body.find(_BIN_MARKER)
+    xml_end = bin_pos if bin_pos != -1 else len(body)
+
+    fields = _find_marked_fields(body, xml_end)
+    csid = fields.get("csid", b"").decode("ascii", errors="ignore")
+    ccid = fields.get("ccid", b"").decode("ascii", errors="ignore")
+    user_id = _parse_int_field(fields.get("userid"))
+    profile_id = _parse_int_field(fields.get("profileid"))
+    authoritative = fields.get("authoritative", b"").decode("ascii", errors="ignore")
+
+    # Extract binary report as a view, without copying it out of the body
+    raw_report = memoryview(b"")
     if bin_pos != -1:
-        raw_report = body[bin_pos + len(bin_marker) :]
+        raw_report = memoryview(body)[bin_pos + _BIN_MARKER_LEN :]
         logger.info("[%s] Found binary report at position %d, size=%d bytes", request_id, bin_pos, len(raw_report))
     else:
         logger.warning("[%s] No binary report marker found in request!", request_id)
@@ -583,12 +741,170 @@ def extract_submit_report_data(body: bytes, request_id: str) -> tuple[str, str,
     return csid, ccid, profile_id, raw_report
 
 
+# Pre-rendered SOAP envelopes for responses that never vary, or only vary by csid/ccid
+_SUBMIT_REPORT_SUCCESS_XML = wrap_soap_envelope_bytes(SubmitReportResponse.success())
+_CREATE_SESSION_TEMPLATE = SoapTemplate(
+    CreateSessionResponse.success(csid="__CSID__", ccid="__CCID__"), ("__CSID__", "__CCID__")
+)
+_SET_REPORT_INTENTION_TEMPLATE = SoapTemplate(
+    SetReportIntentionResponse.success(csid="__CSID__", ccid="__CCID__"), ("__CSID__", "__CCID__")
+)
+
+
+def _render_session_response(
+    template: SoapTemplate, response_model: CreateSessionResponse | SetReportIntentionResponse
+) -> bytes:
+    """Render a csid/ccid response, using the pre-rendered template for successes."""
+    result = response_model.result
+    if result.result == CompetitionResultCode.SUCCESS and not result.message and result.csid and result.ccid:
+        return template.render_bytes({"__CSID__": result.csid, "__CCID__": result.ccid})
+    return wrap_soap_envelope_bytes(response_model)
+
+
+def render_create_session(response_model: CreateSessionResponse) -> bytes:
+    """
+    Render a CreateSession response, using the pre-rendered template for successes.
+
+    Args:
+        response_model: The CreateSession response to render.
+
+    Returns:
+        Complete SOAP envelope as UTF-8 bytes.
+    """
+    return _render_session_response(_CREATE_SESSION_TEMPLATE, response_model)
+
+
+def render_set_report_intention(response_model: SetReportIntentionResponse) -> bytes:
+    """
+    Render a SetReportIntention response, using the pre-rendered template for successes.
+
+    Args:
+        response_model: The SetReportIntention response to render.
+
+    Returns:
+        Complete SOAP envelope as UTF-8 bytes.
+    """
+    return _render_session_response(_SET_REPORT_INTENTION_TEMPLATE, response_model)
+
+
+def _create_session_operation(session: Session, fields: dict[str, str], request_id: str) -> bytes:
+    """Handle CreateSession with the fields parsed from the request."""
+    profile_id = _profile_id_field(fields)
+    logger.info("[%s] CreateSession: profileId=%d", request_id, profile_id)
+    return render_create_session(handle_create_session(session, profile_id))
+
+
+def _set_report_intention_operation(session: Session, fields: dict[str, str], request_id: str) -> bytes:
+    """Handle SetReportIntention with the fields parsed from the request."""
+    csid = fields.get("csid", "")
+    ccid = fields.get("ccid", "")
+    profile_id = _profile_id_field(fields)
+    logger.info(
+        "[%s] SetReportIntention: csid=%s, ccid=%s, profileId=%d",
+        request_id,
+        csid,
+        ccid,
+        profile_id,
+    )
+    return render_set_report_intention(handle_set_report_intention(session, csid, ccid, profile_id))
+
+
+# XML operations keyed by operation name, each returning the rendered SOAP envelope
+# (SubmitReport is handled separately since its body carries binary data after the XML)
+_XML_OPERATIONS: dict[str, Callable[[Session, dict[str, str], str], bytes]] = {
+    "CreateSession": _create_session_operation,
+    "SetReportIntention": _set_report_intention_operation,
+}
+
+
+# Input chunk size for decompressing request bodies
+_GZIP_CHUNK_SIZE = 65536
+
+# Upper bound on the buffer preallocated from a gzip ISIZE footer, which is client-supplied
+_GZIP_MAX_PREALLOCATE = 16 * 1024 * 1024
+
+# Deflate cannot expand its input by more than this ratio, which bounds what a body can really produce
+_DEFLATE_MAX_RATIO = 1032
+
+
+def _gunzip(data: bytes) -> bytearray:
+    """
+    Decompress a gzip request body into a buffer preallocated from its ISIZE footer.
+
+    The footer (uncompressed size modulo 2**32) is only a hint: it is capped by
+    the most the compressed data could expand to, the buffer still grows if the
+    output is larger and is trimmed to the actual size. Concatenated
+    gzip members are decompressed one after another, like gzip.decompress.
+
+    Raises:
+        zlib.error: If the data is not valid gzip.
+        EOFError: If the data ends before the end of a gzip member.
+    """
+    isize = int.from_bytes(data[-4:], "little")
+    out = bytearray(min(isize, len(data) * _DEFLATE_MAX_RATIO, _GZIP_MAX_PREALLOCATE))
+    size = 0
+    view = memoryview(data)
+    while view:
+        decompressor = zlib.decompressobj(wbits=31)
+        consumed = 0
+        while consumed < len(view) and not decompressor.eof:
+            chunk = view[consumed : consumed + _GZIP_CHUNK_SIZE]
+            consumed += len(chunk)
+            output = decompressor.decompress(chunk)
+            out[size : size + len(output)] = output
+            size += len(output)
+        if not decompressor.eof:
+            raise EOFError("Compressed file ended before the end-of-stream marker was reached")
+        # Continue with the next member, if any, after this one's trailer
+        view = view[consumed - len(decompressor.unused_data) :]
+    del out[size:]
+    return out
+
+
+async def _submit_report_operation(
+    body: bytes | bytearray, request_id: str, background_tasks: BackgroundTasks
+) -> bytes:
+    """Extract the SubmitReport fields and binary report from the body, handle and store it."""
+    logger.info("[%s] Handling SubmitReport (binary data expected)", request_id)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[%s] Request body (first 500 bytes): %s", request_id, bytes(body[:500]))
+    csid, ccid, profile_id, raw_report = extract_submit_report_data(body, request_id)
+    submitted = await run_in_threadpool(
+        handle_submit_report, csid, ccid, profile_id, raw_report, request_id, background_tasks
+    )
+    # Reports arriving together are stored in one transaction
+    response_model = await report_batcher.submit(store_submitted_report, submitted)
+    if response_model.result.result == CompetitionResultCode.SUCCESS:
+        return _SUBMIT_REPORT_SUCCESS_XML
+    return wrap_soap_envelope_bytes(response_model)
+
+
+def _run_xml_operation(
+    operation_handler: Callable[[Session, dict[str, str], str], bytes], fields: dict[str, str], request_id: str
+) -> bytes:
+    """Run an XML operation in its own transaction."""
+    with session_scope() as session:
+        return operation_handler(session, fields, request_id)
+
+
+# Operations named by a SOAPAction that this service handles
+_KNOWN_OPERATIONS = frozenset(("SubmitReport", *_XML_OPERATIONS))
+
+
+def _action_to_operation(soap_action: str) -> str:
+    """Get the operation name from a SOAPAction URI (e.g. http://gamespy.net/competition/CreateSession)."""
+    return soap_action.rsplit("/", 1)[-1]
+
+
 @competition_router.post("/competitionservice/competitionservice.asmx")
-async def competition_handler(request: Request) -> Response:
+async def competition_handler(request: Request, background_tasks: BackgroundTasks) -> Response:
     """
     Main handler for Competition Service SOAP requests.
 
-    Routes requests based on SOAPAction header.
+    Routes requests based on SOAPAction header. The synchronous database work
+    of each operation runs in the threadpool so it does not block the event loop.
+    Only the XML operations open a session; unknown actions do no database work
+    and SubmitReport is stored by the report batcher.
     """
     # Generate unique request ID for tracing
     request_id = str(uuid.uuid4())[:8]
@@ -604,58 +920,44 @@ async def competition_handler(request: Request) -> Response:
             soap_action,
         )
 
+        # Unknown actions get the generic success without reading or decompressing the body.
+        # Requests without a SOAPAction are still parsed, as their SOAP body names the operation.
+        action_operation = _action_to_operation(soap_action)
+        if soap_action and action_operation not in _KNOWN_OPERATIONS:
+            logger.warning("[%s] Unknown SOAPAction, returning generic success", request_id)
+            return Response(content=_SUBMIT_REPORT_SUCCESS_XML, media_type="text/xml; charset=utf-8")
+
         body = await request.body()
         original_size = len(body)
 
         # Check for gzip compression (magic bytes 0x1f 0x8b)
         if len(body) >= 2 and body[0] == 0x1F and body[1] == 0x8B:
-            body = gzip.decompress(body)
+            body = _gunzip(body)
             logger.info("[%s] Decompressed gzip: %d -> %d bytes", request_id, original_size, len(body))
         else:
             logger.info("[%s] Request body size: %d bytes", request_id, len(body))
 
         # SubmitReport has binary data appended after XML, handle it specially
-        if "SubmitReport" in soap_action:
-            logger.info("[%s] Handling SubmitReport (binary data expected)", request_id)
-            logger.debug("[%s] Request body (first 500 bytes): %s", request_id, body[:500])
-            csid, ccid, profile_id, raw_report = extract_submit_report_data(body, request_id)
-            response_model = handle_submit_report(csid, ccid, profile_id, raw_report, request_id)
-            response_xml = wrap_soap_envelope(response_model)
+        if action_operation == "SubmitReport":
+            response_xml = await _submit_report_operation(body, request_id, background_tasks)
         else:
-            # For other operations, parse as pure XML
-            xml_content = body.decode("utf-8")
-            logger.debug("[%s] Request body: %s", request_id, xml_content[:500])
+            # For other operations, stream-parse the XML for just the fields they use
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[%s] Request body: %s", request_id, body[:500].decode("utf-8", errors="replace"))
 
-            operation = extract_soap_body(xml_content)
-            operation_name = get_operation_name(operation)
+            operation_name, fields = parse_operation_fields(body)
             logger.info("[%s] Operation: %s", request_id, operation_name)
 
-            if "CreateSession" in soap_action or operation_name == "CreateSession":
-                profile_id = extract_profile_id_from_certificate(operation)
-                logger.info("[%s] CreateSession: profileId=%d", request_id, profile_id)
-                response_model = handle_create_session(profile_id)
-                response_xml = wrap_soap_envelope(response_model)
-
-            elif "SetReportIntention" in soap_action or operation_name == "SetReportIntention":
-                csid = get_element_text(operation, "csid")
-                ccid = get_element_text(operation, "ccid")
-                profile_id = extract_profile_id_from_certificate(operation)
-                logger.info(
-                    "[%s] SetReportIntention: csid=%s, ccid=%s, profileId=%d",
-                    request_id,
-                    csid,
-                    ccid,
-                    profile_id,
-                )
-                response_model = handle_set_report_intention(csid, ccid, profile_id)
-                response_xml = wrap_soap_envelope(response_model)
-
+            # The operation in the SOAP body is authoritative, SOAPAction is the fallback
+            operation_handler = _XML_OPERATIONS.get(operation_name) or _XML_OPERATIONS.get(action_operation)
+            if operation_handler is not None:
+                response_xml = await run_in_threadpool(_run_xml_operation, operation_handler, fields, request_id)
             else:
                 logger.warning("[%s] Unknown operation, returning generic success", request_id)
-                response_model = SubmitReportResponse.success()
-                response_xml = wrap_soap_envelope(response_model)
+                response_xml = _SUBMIT_REPORT_SUCCESS_XML
 
-        logger.debug("[%s] Response: %s", request_id, response_xml[:500])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[%s] Response: %s", request_id, response_xml[:500].decode("utf-8", errors="replace"))
         logger.info("[%s] === RESPONSE === Success", request_id)
 
         return Response(
@@ -5,9 +5,12 @@ This module provides utilities to wrap pydantic_xml models in SOAP envelopes
 and parse SOAP request bodies into pydantic_xml models.
 """
 
-import xml.etree.ElementTree as ET
+import re
+from collections.abc import Iterable
 from typing import TypeVar
+from xml.sax.saxutils import escape
 
+from lxml import etree
 from pydantic_xml import BaseXmlModel
 
 # Namespace definitions
@@ -17,6 +20,22 @@ XSD_NS = "http://www.w3.org/2001/XMLSchema"
 
 T = TypeVar("T", bound=BaseXmlModel)
 
+# Shared lxml parser for SOAP requests; entity expansion and network access are disabled
+_SOAP_PARSER = etree.XMLParser(resolve_entities=False, no_network=True, huge_tree=False)
+
+
+# Envelope text surrounding the body content of every response
+_ENVELOPE_START = (
+    '<?xml version="1.0" encoding="utf-8"?>'
+    '<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/" '
+    'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+    'xmlns:xsd="http://www.w3.org/2001/XMLSchema">'
+    "<soap:Body>"
+)
+_ENVELOPE_END = "</soap:Body></soap:Envelope>"
+_ENVELOPE_START_BYTES = _ENVELOPE_START.encode("utf-8")
+_ENVELOPE_END_BYTES = _ENVELOPE_END.encode("utf-8")
+
 
 def wrap_soap_envelope(body_content: BaseXmlModel) -> str:
     """
@@ -28,15 +47,20 @@ def wrap_soap_envelope(body_content: BaseXmlModel) -> str:
     Returns:
         Complete SOAP envelope as an XML string.
     """
-    body_xml = body_content.to_xml(encoding="unicode")
-    return (
-        '<?xml version="1.0" encoding="utf-8"?>'
-        '<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/" '
-        'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
-        'xmlns:xsd="http://www.w3.org/2001/XMLSchema">'
-        f"<soap:Body>{body_xml}</soap:Body>"
-        "</soap:Envelope>"
-    )
+    return _ENVELOPE_START + body_content.to_xml(encoding="unicode") + _ENVELOPE_END
+
+
+def wrap_soap_envelope_bytes(body_content: BaseXmlModel) -> bytes:
+    """
+    Wrap a pydantic_xml model in a SOAP envelope, serializing straight to UTF-8.
+
+    Args:
+        body_content: A pydantic_xml model instance to wrap.
+
+    Returns:
+        Complete SOAP envelope as UTF-8 bytes, ready to use as a response body.
+    """
+    return _ENVELOPE_START_BYTES + body_content.to_xml(encoding="utf-8") + _ENVELOPE_END_BYTES
 
 
 def wrap_soap_envelope_raw(body_content: str) -> str:
@@ -49,22 +73,80 @@ def wrap_soap_envelope_raw(body_content: str) -> str:
     Returns:
         Complete SOAP envelope as an XML string.
     """
-    return (
-        '<?xml version="1.0" encoding="utf-8"?>'
-        '<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/" '
-        'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
-        'xmlns:xsd="http://www.w3.org/2001/XMLSchema">'
-        f"<soap:Body>{body_content}</soap:Body>"
-        "</soap:Envelope>"
-    )
+    return _ENVELOPE_START + body_content + _ENVELOPE_END
 
 
-def extract_soap_body(xml_content: str | bytes) -> ET.Element:
+class SoapTemplate:
+    """
+    Pre-rendered SOAP envelope with placeholders for the values that vary per response.
+
+    The envelope is serialized once from a model whose variable fields hold
+    placeholder strings (build it with model_construct so int fields can hold them).
+    Rendering only escapes and joins the values, skipping pydantic_xml entirely.
+    """
+
+    def __init__(self, body_content: BaseXmlModel, placeholders: Iterable[str]):
+        """
+        Args:
+            body_content: Model to render, with placeholder strings in the variable fields.
+            placeholders: Placeholder strings used in the model. A placeholder may appear more than once.
+        """
+        envelope = wrap_soap_envelope(body_content)
+        pattern = re.compile("|".join(re.escape(placeholder) for placeholder in placeholders))
+        self._parts: list[str] = []
+        self._names: list[str] = []
+        start = 0
+        for match in pattern.finditer(envelope):
+            self._parts.append(envelope[start : match.start()])
+            self._names.append(match.group())
+            start = match.end()
+        self._tail = envelope[start:]
+        # UTF-8 encoded copies of the fixed text, for rendering straight to bytes
+        self._parts_bytes = [part.encode("utf-8") for part in self._parts]
+        self._tail_bytes = self._tail.encode("utf-8")
+
+    def render(self, values: dict[str, object]) -> str:
+        """
+        Render the envelope with the given placeholder values.
+
+        Args:
+            values: Value for each placeholder. Values are converted with str() and XML-escaped.
+
+        Returns:
+            Complete SOAP envelope as an XML string.
+        """
+        chunks = []
+        for part, name in zip(self._parts, self._names):
+            chunks.append(part)
+            chunks.append(escape(str(values[name])))
+        chunks.append(self._tail)
+        return "".join(chunks)
+
+    def render_bytes(self, values: dict[str, object]) -> bytes:
+        """
+        Render the envelope as UTF-8 bytes; only the placeholder values are encoded.
+
+        Args:
+            values: Value for each placeholder. Values are converted with str() and XML-escaped.
+
+        Returns:
+            Complete SOAP envelope as UTF-8 bytes, equal to render(values).encode("utf-8").
+        """
+        chunks = []
+        for part, name in zip(self._parts_bytes, self._names):
+            chunks.append(part)
+            chunks.append(escape(str(values[name])).encode("utf-8"))
+        chunks.append(self._tail_bytes)
+        return b"".join(chunks)
+
+
+def extract_soap_body(xml_content: str | bytes | bytearray) -> etree._Element:
     """
     Extract the operation element from a SOAP envelope body.
 
     Args:
-        xml_content: The raw SOAP envelope XML.
+        xml_content: The raw SOAP envelope XML. Request bodies can be passed
+            as bytes directly without decoding them first.
 
     Returns:
         The first child element inside the SOAP Body.
@@ -72,35 +154,26 @@ def extract_soap_body(xml_content: str | bytes) -> ET.Element:
     Raises:
         ValueError: If SOAP Body or operation is not found.
     """
-    if isinstance(xml_content, bytes):
-        xml_content = xml_content.decode("utf-8")
-
-    root = ET.fromstring(xml_content)
+    # lxml rejects str input that carries an encoding declaration, so always parse bytes
+    if isinstance(xml_content, str):
+        xml_content = xml_content.encode("utf-8")
 
-    # Find the Body element
-    body = None
-    for child in root:
-        tag = child.tag.split("}")[-1] if "}" in child.tag else child.tag
-        if tag == "Body":
-            body = child
-            break
+    root = etree.fromstring(xml_content, _SOAP_PARSER)
 
+    # Find the Body element (any namespace prefix)
+    body = root.find("{*}Body")
     if body is None:
         raise ValueError("SOAP Body not found")
 
-    # Get the first child of Body (the operation element)
-    operation = None
-    for child in body:
-        operation = child
-        break
-
+    # Get the first child element of Body (the operation element)
+    operation = body.find("*")
     if operation is None:
         raise ValueError("SOAP operation not found in Body")
 
     return operation
 
 
-def get_operation_name(operation: ET.Element) -> str:
+def get_operation_name(operation: etree._Element) -> str:
     """
     Extract the operation name from an operation element.
 
@@ -110,8 +183,7 @@ def get_operation_name(operation: ET.Element) -> str:
     Returns:
         The operation name without namespace prefix.
     """
-    tag = operation.tag
-    return tag.split("}")[-1] if "}" in tag else tag
+    return etree.QName(operation).localname
 
 
 def parse_soap_body(xml_content: str | bytes, model_class: type[T]) -> T:
@@ -131,12 +203,12 @@ def parse_soap_body(xml_content: str | bytes, model_class: type[T]) -> T:
     operation = extract_soap_body(xml_content)
 
     # Convert the operation element back to XML string for pydantic_xml
-    operation_xml = ET.tostring(operation, encoding="unicode")
+    operation_xml = etree.tostring(operation, encoding="unicode")
 
     return model_class.from_xml(operation_xml)
 
 
-def get_element_text(element: ET.Element, tag: str) -> str:
+def get_element_text(element: etree._Element, tag: str) -> str:
     """
     Get text content of a child element by tag name.
 
@@ -147,14 +219,38 @@ def get_element_text(element: ET.Element, tag: str) -> str:
     Returns:
         The text content of the found element, or empty string if not found.
     """
-    for child in element:
-        child_tag = child.tag.split("}")[-1] if "}" in child.tag else child.tag
-        if child_tag == tag:
-            return child.text or ""
-    return ""
+    child = element.find("{*}" + tag)
+    if child is None:
+        return ""
+    return child.text or ""
 
 
-def get_child_element(element: ET.Element, tag: str) -> ET.Element | None:
+def get_elements_text(element: etree._Element, tags: Iterable[str]) -> dict[str, str]:
+    """
+    Get text content of several child elements in a single pass.
+
+    Args:
+        element: Parent element to search in.
+        tags: Tag names to find (without namespace).
+
+    Returns:
+        Dict mapping each requested tag to the text of the first matching child,
+        or empty string if not found.
+    """
+    remaining = set(tags)
+    texts = dict.fromkeys(remaining, "")
+    for child in element.iterchildren(etree.Element):
+        tag = child.tag
+        local_tag = tag[tag.rfind("}") + 1 :]
+        if local_tag in remaining:
+            texts[local_tag] = child.text or ""
+            remaining.discard(local_tag)
+            if not remaining:
+                break
+    return texts
+
+
+def get_child_element(element: etree._Element, tag: str) -> etree._Element | None:
     """
     Get a child element by tag name.
 
@@ -165,11 +261,7 @@ def get_child_element(element: ET.Element, tag: str) -> ET.Element | None:
     Returns:
         The found element, or None if not found.
     """
-    for child in element:
-        child_tag = child.tag.split("}")[-1] if "}" in child.tag else child.tag
-        if child_tag == tag:
-            return child
-    return None
+    return element.find("{*}" + tag)
 
 
 def create_soap_fault(fault_string: str, fault_code: str = "soap:Server") -> str:
@@ -4,6 +4,8 @@ Common pydantic_xml models shared across SOAP services.
 These models handle the RecordValue structure used by Sake and other services.
 """
 
+from collections.abc import Iterable
+
 from pydantic_xml import BaseXmlModel, element
 
 
@@ -75,3 +77,24 @@ class ArrayOfRecordValue(BaseXmlModel, tag="ArrayOfRecordValue"):
     def from_shorts(cls, values: list[int]) -> "ArrayOfRecordValue":
         """Create an ArrayOfRecordValue from a list of short integers."""
         return cls(records=[RecordValue.from_short(v) for v in values])
+
+    @staticmethod
+    def xml_from_ints(values: Iterable[int]) -> str:
+        """
+        Serialize integers straight to ArrayOfRecordValue XML, without building the models.
+
+        Produces the same XML as from_ints(values).to_xml(), for splicing large
+        arrays into pre-rendered responses.
+        """
+        return _xml_from_values("intValue", values)
+
+    @staticmethod
+    def xml_from_shorts(values: Iterable[int]) -> str:
+        """Serialize short integers straight to ArrayOfRecordValue XML, like from_shorts(values).to_xml()."""
+        return _xml_from_values("shortValue", values)
+
+
+def _xml_from_values(value_tag: str, values: Iterable[int]) -> str:
+    """Serialize integer record values wrapped in value_tag as an ArrayOfRecordValue element."""
+    records = "".join(f"<RecordValue><{value_tag}><value>{int(v)}</value></{value_tag}></RecordValue>" for v in values)
+    return f"<ArrayOfRecordValue>{records}</ArrayOfRecordValue>" if records else "<ArrayOfRecordValue/>"
@@ -12,9 +12,10 @@ The game relies on this service for displaying stats, ranks, and leaderboards.
 """
 
 import base64
-import xml.etree.ElementTree as ET
+import logging
 
 from fastapi import APIRouter, Request, Response
+from lxml import etree
 from sqlmodel import select
 
 from app.db.crud import get_player_level, get_player_stats
@@ -23,11 +24,12 @@ from app.models.models import Persona
 from app.soap.envelope import (
     create_soap_fault,
     extract_soap_body,
-    get_element_text,
+    get_elements_text,
     get_operation_name,
     wrap_soap_envelope,
+    wrap_soap_envelope_bytes,
 )
-from app.soap.models.common import RecordValue
+from app.soap.models.common import ArrayOfRecordValue, RecordValue
 from app.soap.models.sake import (
     GetMyRecordsResponse,
     GetSpecificRecordsResponse,
@@ -159,16 +161,13 @@ def parse_login_ticket(login_ticket: str) -> tuple[int, int]:
     return 0, 0
 
 
-def get_requested_fields(operation: ET.Element) -> list[str]:
+def get_requested_fields(operation: etree._Element) -> list[str]:
     """Extract the list of requested field names from the SOAP request."""
     fields = []
-    for child in operation:
-        child_tag = child.tag.split("}")[-1] if "}" in child.tag else child.tag
-        if child_tag == "fields":
-            for field_elem in child:
-                field_tag = field_elem.tag.split("}")[-1] if "}" in field_elem.tag else field_elem.tag
-                if field_tag == "string" and field_elem.text:
-                    fields.append(field_elem.text)
+    for child in operation.iterfind("{*}fields"):
+        for field_elem in child.iterfind("{*}string"):
+            if field_elem.text:
+                fields.append(field_elem.text)
     return fields
 
 
@@ -271,9 +270,9 @@ def handle_get_specific_records(table_id: str, login_ticket: str) -> GetSpecific
         return GetSpecificRecordsResponse.success_empty()
 
 
-def handle_search_for_records(table_id: str, filter_str: str, login_ticket: str) -> SearchForRecordsResponse:
+def _search_record_rows(table_id: str, filter_str: str, login_ticket: str) -> list[list[int]] | None:
     """
-    Handle SearchForRecords SOAP operation.
+    Run a SearchForRecords search and return the integer values of each result row.
 
     Handles searches for:
     - Levels: XP thresholds for 87 ranks
@@ -287,23 +286,23 @@ def handle_search_for_records(table_id: str, filter_str: str, login_ticket: str)
         login_ticket: The login ticket for authentication validation.
 
     Returns:
-        SearchForRecordsResponse with search results.
+        One list of values per result row (one ArrayOfRecordValue each),
+        or None if the login ticket is invalid.
     """
     # Validate login ticket
     user_id, profile_id = parse_login_ticket(login_ticket)
     if user_id == 0 or profile_id == 0:
         logger.warning("Sake SearchForRecords: Invalid login ticket")
-        return SearchForRecordsResponse.error(SAKEResultCode.LOGIN_TICKET_INVALID)
+        return None
 
     logger.debug("Sake SearchForRecords: tableid=%s, filter=%s", table_id, filter_str)
 
-    record_lists: list[list[RecordValue]] = []
+    rows: list[list[int]] = []
 
     # Handle Levels table - return XP thresholds
     if "Levels" in str(table_id) or "levels" in str(filter_str).lower():
-        for threshold in LEVEL_THRESHOLDS:
-            # Each level is a single-element ArrayOfRecordValue
-            record_lists.append([RecordValue.from_int(threshold)])
+        # Each level is a single-element ArrayOfRecordValue
+        rows = [[threshold] for threshold in LEVEL_THRESHOLDS]
 
     # Handle PlayerStats_v5 - leaderboard or ownerid lookup
     elif "PlayerStats" in str(table_id) or "playerstats" in str(filter_str).lower():
@@ -320,12 +319,7 @@ def handle_search_for_records(table_id: str, filter_str: str, login_ticket: str)
             owner_id = int(owner_id_str) if owner_id_str else 0
 
             # Return single ArrayOfRecordValue with [rank, ownerId]
-            record_lists.append(
-                [
-                    RecordValue.from_int(57),
-                    RecordValue.from_int(owner_id),
-                ]
-            )
+            rows.append([57, owner_id])
         else:
             # General leaderboard query
             session = create_session()
@@ -339,13 +333,7 @@ def handle_search_for_records(table_id: str, filter_str: str, login_ticket: str)
                     score = level.score if level else 0
 
                     # Each player is an ArrayOfRecordValue with [profileId, rank, score]
-                    record_lists.append(
-                        [
-                            RecordValue.from_int(persona.id),
-                            RecordValue.from_int(rank),
-                            RecordValue.from_int(score),
-                        ]
-                    )
+                    rows.append([persona.id, rank, score])
             finally:
                 session.close()
 
@@ -359,10 +347,61 @@ def handle_search_for_records(table_id: str, filter_str: str, login_ticket: str)
         # Return empty custom maps list (can be expanded)
         pass
 
-    if record_lists:
-        return SearchForRecordsResponse.success(record_lists)
-    else:
-        return SearchForRecordsResponse.success_empty()
+    return rows
+
+
+def handle_search_for_records(table_id: str, filter_str: str, login_ticket: str) -> SearchForRecordsResponse:
+    """
+    Handle SearchForRecords SOAP operation.
+
+    Args:
+        table_id: The table identifier.
+        filter_str: The filter string for the search.
+        login_ticket: The login ticket for authentication validation.
+
+    Returns:
+        SearchForRecordsResponse with search results.
+    """
+    rows = _search_record_rows(table_id, filter_str, login_ticket)
+    if rows is None:
+        return SearchForRecordsResponse.error(SAKEResultCode.LOGIN_TICKET_INVALID)
+    if rows:
+        return SearchForRecordsResponse.success([[RecordValue.from_int(v) for v in row] for row in rows])
+    return SearchForRecordsResponse.success_empty()
+
+
+# Envelope text around the result arrays of a successful SearchForRecords response,
+# split out of a rendered single-row response
+_SEARCH_RESULTS_START, _SEARCH_RESULTS_END = (
+    part.encode("utf-8")
+    for part in wrap_soap_envelope(SearchForRecordsResponse.success([[RecordValue.from_int(0)]])).split(
+        ArrayOfRecordValue.xml_from_ints([0])
+    )
+)
+
+
+def render_search_for_records(table_id: str, filter_str: str, login_ticket: str) -> bytes:
+    """
+    Handle SearchForRecords and render the SOAP envelope.
+
+    Result rows are serialized straight into the pre-rendered envelope instead
+    of building a RecordValue model per value.
+
+    Args:
+        table_id: The table identifier.
+        filter_str: The filter string for the search.
+        login_ticket: The login ticket for authentication validation.
+
+    Returns:
+        Complete SOAP envelope as UTF-8 bytes, the same as wrapping handle_search_for_records.
+    """
+    rows = _search_record_rows(table_id, filter_str, login_ticket)
+    if rows is None:
+        return wrap_soap_envelope_bytes(SearchForRecordsResponse.error(SAKEResultCode.LOGIN_TICKET_INVALID))
+    if not rows:
+        return wrap_soap_envelope_bytes(SearchForRecordsResponse.success_empty())
+    arrays = "".join(ArrayOfRecordValue.xml_from_ints(row) for row in rows)
+    return _SEARCH_RESULTS_START + arrays.encode("utf-8") + _SEARCH_RESULTS_END
 
 
 @sake_router.post("/SakeStorageServer/StorageServer.asmx")
@@ -377,41 +416,43 @@ async def sake_storage_handler(request: Request) -> Response:
         logger.debug("Sake: SOAPAction=%s", soap_action)
 
         body = await request.body()
-        xml_content = body.decode("utf-8")
-        logger.debug("Sake: Request body=%s", xml_content[:500])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sake: Request body=%s", body[:500].decode("utf-8", errors="replace"))
 
-        operation = extract_soap_body(xml_content)
+        operation = extract_soap_body(body)
         operation_name = get_operation_name(operation)
         logger.debug("Sake: Operation=%s", operation_name)
 
         if "GetMyRecords" in soap_action or operation_name == "GetMyRecords":
-            login_ticket = get_element_text(operation, "loginTicket")
-            profile_id_str = get_element_text(operation, "profileId")
-            profile_id = int(profile_id_str) if profile_id_str else 0
+            texts = get_elements_text(operation, ("loginTicket", "profileId"))
+            login_ticket = texts["loginTicket"]
+            profile_id = int(texts["profileId"]) if texts["profileId"] else 0
             requested_fields = get_requested_fields(operation)
 
             response_model = handle_get_my_records(login_ticket, profile_id, requested_fields)
-            response_xml = wrap_soap_envelope(response_model)
+            response_xml = wrap_soap_envelope_bytes(response_model)
 
         elif "GetSpecificRecords" in soap_action or operation_name == "GetSpecificRecords":
-            table_id = get_element_text(operation, "tableid")
-            login_ticket = get_element_text(operation, "loginTicket")
+            texts = get_elements_text(operation, ("tableid", "loginTicket"))
+            table_id = texts["tableid"]
+            login_ticket = texts["loginTicket"]
             response_model = handle_get_specific_records(table_id, login_ticket)
-            response_xml = wrap_soap_envelope(response_model)
+            response_xml = wrap_soap_envelope_bytes(response_model)
 
         elif "SearchForRecords" in soap_action or operation_name == "SearchForRecords":
-            table_id = get_element_text(operation, "tableid")
-            filter_str = get_element_text(operation, "filter")
-            login_ticket = get_element_text(operation, "loginTicket")
-            response_model = handle_search_for_records(table_id, filter_str, login_ticket)
-            response_xml = wrap_soap_envelope(response_model)
+            texts = get_elements_text(operation, ("tableid", "filter", "loginTicket"))
+            table_id = texts["tableid"]
+            filter_str = texts["filter"]
+            login_ticket = texts["loginTicket"]
+            response_xml = render_search_for_records(table_id, filter_str, login_ticket)
 
         else:
             # Return generic success for unknown operations
             response_model = GetMyRecordsResponse(result="Success")
-            response_xml = wrap_soap_envelope(response_model)
+            response_xml = wrap_soap_envelope_bytes(response_model)
 
-        logger.debug("Sake: Response=%s", response_xml[:500])
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Sake: Response=%s", response_xml[:500].decode("utf-8", errors="replace"))
 
         return Response(
             content=response_xml,
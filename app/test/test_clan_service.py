@@ -0,0 +1,71 @@
+"""
+Tests for the conditional GET handling of the constant clan service responses.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.soap.clan_service import _DEFAULT_LADDER, _LARGE_RANK_ICON, _NOT_MEMBER, _SMALL_RANK_ICON, clan_router
+
+# Endpoints answered with a cached payload, with the query that selects it
+CACHED_ENDPOINTS = [
+    pytest.param("/GetPlayerRankIcon.aspx?size=L", _LARGE_RANK_ICON, id="large_rank_icon"),
+    pytest.param("/GetPlayerRankIcon.aspx", _SMALL_RANK_ICON, id="small_rank_icon"),
+    pytest.param("/clans/ClanActions.asmx/ClanInfoByProfileID?profileid=0", _NOT_MEMBER, id="not_member"),
+    pytest.param("/GetPlayerLadderRatings.aspx", _DEFAULT_LADDER, id="default_ladder"),
+]
+
+
+@pytest.fixture(scope="module")
+def client():
+    """Client for an app serving only the clan endpoints."""
+    app = FastAPI()
+    app.include_router(clan_router)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def assert_not_modified(response, payload):
+    """Assert a 304 that still carries the ETag and has no body."""
+    assert response.status_code == 304
+    assert response.headers["etag"] == payload.etag
+    assert response.content == b""
+
+
+@pytest.mark.parametrize("url, payload", CACHED_ENDPOINTS)
+class TestCachedPayload:
+    """Tests for If-None-Match handling on cached clan service payloads."""
+
+    def test_full_response_without_if_none_match(self, client, url, payload):
+        """Test a request without If-None-Match gets the full body and its ETag."""
+        response = client.get(url)
+        assert response.status_code == 200
+        assert response.headers["etag"] == payload.etag
+        assert response.content == payload.response.body
+
+    def test_exact_match_not_modified(self, client, url, payload):
+        """Test the payload's own ETag is answered with 304."""
+        response = client.get(url, headers={"If-None-Match": payload.etag})
+        assert_not_modified(response, payload)
+
+    def test_non_match_full_response(self, client, url, payload):
+        """Test a different ETag gets the full body."""
+        response = client.get(url, headers={"If-None-Match": '"0123456789abcdef"'})
+        assert response.status_code == 200
+        assert response.content == payload.response.body
+
+    def test_match_in_list_not_modified(self, client, url, payload):
+        """Test the ETag is matched anywhere in a comma-separated list."""
+        response = client.get(url, headers={"If-None-Match": f'"0123456789abcdef", {payload.etag} ,"fedcba"'})
+        assert_not_modified(response, payload)
+
+    def test_weak_match_not_modified(self, client, url, payload):
+        """Test a weak W/ tag matches, since If-None-Match uses weak comparison."""
+        response = client.get(url, headers={"If-None-Match": f'"0123456789abcdef", W/{payload.etag}'})
+        assert_not_modified(response, payload)
+
+    def test_wildcard_not_modified(self, client, url, payload):
+        """Test * matches any current representation."""
+        response = client.get(url, headers={"If-None-Match": "*"})
+        assert_not_modified(response, payload)
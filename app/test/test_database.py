@@ -0,0 +1,45 @@
+"""
+Tests for the request-scoped database session dependency.
+"""
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, SQLModel, select
+
+from app.db.database import engine, get_db
+from app.models.models import Persona
+
+
+class TestGetDb:
+    """Tests for get_db transaction handling."""
+
+    @pytest.fixture(autouse=True)
+    def setup_database(self):
+        """Set up a fresh database for each test."""
+        SQLModel.metadata.create_all(engine)
+        yield
+        SQLModel.metadata.drop_all(engine)
+
+    def test_changes_committed_after_handler(self):
+        """Test changes made by a handler that returns normally are committed."""
+        dependency = get_db()
+        session = next(dependency)
+        session.add(Persona(name="Committed", user_id=1))
+
+        with pytest.raises(StopIteration):
+            next(dependency)
+
+        with Session(engine) as check:
+            assert check.exec(select(Persona).where(Persona.name == "Committed")).first() is not None
+
+    def test_failed_flush_handled_by_handler_is_rolled_back(self):
+        """Test a handler that catches a failed flush (e.g. to return a SOAP fault) does not break teardown."""
+        dependency = get_db()
+        session = next(dependency)
+        session.add(Persona(name=None, user_id=None))
+        with pytest.raises(IntegrityError):
+            session.flush()
+
+        # Teardown rolls back instead of committing, which would raise PendingRollbackError
+        with pytest.raises(StopIteration):
+            next(dependency)
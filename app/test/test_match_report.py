@@ -0,0 +1,128 @@
+"""
+Tests for the binary match report parser.
+
+Reports are built in the same layout the game sends after a match:
+a fixed header, then roster, auth, result, game, player and team sections.
+"""
+
+import struct
+import uuid
+
+import pytest
+
+from app.models.match_report import REPORT_HEADER, BinaryReader, Faction, MatchReport, ValueType
+
+
+def encode_value(value_type: ValueType, value) -> bytes:
+    """Encode a typed data value."""
+    if value_type == ValueType.INT32:
+        return struct.pack(">Hi", value_type, value)
+    if value_type == ValueType.INT16:
+        return struct.pack(">Hh", value_type, value)
+    if value_type == ValueType.BYTE:
+        return struct.pack(">HB", value_type, value)
+    encoded = value.encode("utf-8")
+    return struct.pack(">HB", value_type, len(encoded)) + encoded
+
+
+def build_report(players: list[tuple[int, bool, int]], map_path: str = "data/maps/official/map_mp_2") -> bytes:
+    """
+    Build a binary match report.
+
+    Args:
+        players: List of (persona_id, is_winner, faction_key) tuples.
+        map_path: Map path stored in game section key 61.
+    """
+    roster = b"".join(
+        uuid.UUID(f"00000000-0000-0000-0000-{persona_id:08x}0000").bytes + struct.pack(">i", team_id)
+        for team_id, (persona_id, _, _) in enumerate(players)
+    )
+    auth = b"\x01\x02"
+    result = b"".join(bytes([0, 0, 0, 0 if is_winner else 1]) for _, is_winner, _ in players)
+    game = (
+        struct.pack(">H", 61)
+        + encode_value(ValueType.STRING, map_path)
+        + struct.pack(">H", 62)
+        + encode_value(ValueType.INT32, 321)
+        + struct.pack(">H", 73)  # 72 + game_type 1 (ranked 1v1)
+        + encode_value(ValueType.INT16, 1)
+    )
+    player = b"".join(
+        struct.pack(">HH", 2, faction_key)
+        + encode_value(ValueType.INT16, 1)
+        + struct.pack(">H", 40)
+        + encode_value(ValueType.BYTE, 7)
+        for _, _, faction_key in players
+    )
+    team = b""
+
+    header = struct.pack(">II16sIIHHHHH2x", 1, 2, b"c" * 16, 3, 4, len(players), 0, 3, 2, 0)
+    header += struct.pack(">iiiiii", len(roster), len(auth), len(result), len(game), len(player), len(team))
+    return header + roster + auth + result + game + player + team
+
+
+class TestMatchReportParsing:
+    """Tests for MatchReport.from_bytes."""
+
+    def test_header_fields(self):
+        """Test the fixed header is decoded into the report fields."""
+        report = MatchReport.from_bytes(build_report([(11, True, 1), (12, False, 6)]))
+
+        assert report.protocol_version == 1
+        assert report.developer_version == 2
+        assert report.checksum == b"c" * 16
+        assert report.game_status == 3
+        assert report.flags == 4
+        assert report.player_count == 2
+        assert report.game_key_count == 3
+        assert REPORT_HEADER.size == 68
+
+    def test_players_and_game_section(self):
+        """Test roster, result, player and game sections resolve to players."""
+        report = MatchReport.from_bytes(build_report([(11, True, 1), (12, False, 6)]))
+        players = report.get_player_list()
+
+        assert [p.persona_id for p in players] == [11, 12]
+        assert [p.is_winner for p in players] == [True, False]
+        assert [p.faction for p in players] == [Faction.ALLIED, Faction.SOVIET]
+        assert report.is_auto_match
+        assert report.get_map_path() == "data/maps/official/map_mp_2"
+        assert report.get_duration() == 321
+        assert report.get_game_type_from_key() == 1
+        assert report.get_winner_id_list() == [11]
+        assert report.get_loser_id_list() == [12]
+
+    def test_truncated_header_raises(self):
+        """Test a report shorter than the header is rejected."""
+        with pytest.raises(struct.error):
+            MatchReport.from_bytes(build_report([(11, True, 1)])[: REPORT_HEADER.size - 1])
+
+    def test_data_values_decoded_by_type(self):
+        """Test each value type is decoded and advances the reader past it."""
+        data = (
+            encode_value(ValueType.INT32, -5)
+            + encode_value(ValueType.INT16, -2)
+            + encode_value(ValueType.BYTE, 200)
+            + encode_value(ValueType.STRING, "map")
+        )
+        reader = BinaryReader(data)
+
+        assert [reader.read_data_value().value for _ in range(4)] == [-5, -2, 200, "map"]
+        assert reader.is_empty()
+
+    def test_unknown_value_type_raises(self):
+        """Test an unknown value type is rejected."""
+        with pytest.raises(ValueError):
+            BinaryReader(struct.pack(">Hi", 9, 1)).read_data_value()
+
+    def test_memoryview_input_matches_bytes(self):
+        """Test a report passed as a view into the request body parses the same as bytes."""
+        data = build_report([(11, True, 1), (12, False, 6)])
+        body = b"<xml/>application/bin\x00" + data
+
+        view_report = MatchReport.from_bytes(memoryview(body)[len(body) - len(data) :])
+        bytes_report = MatchReport.from_bytes(data)
+
+        assert view_report.get_player_list() == bytes_report.get_player_list()
+        assert view_report.get_map_path() == bytes_report.get_map_path()
+        assert view_report.result_section == bytes_report.result_section
@@ -0,0 +1,247 @@
+"""
+Tests for the ReportBatcher group commit of match report writes.
+"""
+
+import asyncio
+import gzip
+from contextlib import asynccontextmanager
+
+import pytest
+from fastapi import BackgroundTasks, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.pool import StaticPool
+from sqlmodel import Session, SQLModel, create_engine, select
+
+import app.db.report_batcher as report_batcher_module
+from app.db.crud import (
+    create_competition_session,
+    create_new_user,
+    create_persona_for_user,
+    get_competition_session,
+    get_match_reports_for_session,
+    set_report_intention,
+)
+from app.db.report_batcher import ReportBatcher, report_batcher
+from app.models.models import Persona, UserCreate
+from app.soap import competition_service
+from app.soap.competition_service import competition_router, handle_submit_report, store_submitted_report
+from app.soap.models.competition import CompetitionResultCode
+from app.test.test_match_report import build_report
+
+
+class TestReportBatcher:
+    """Tests for batching store functions into shared transactions."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.sessions = []
+
+    def store(self, session, value):
+        """Record the session used and return a result derived from the value."""
+        self.sessions.append(session)
+        return value * 2
+
+    def failing_store(self, session, value):
+        """Record the session used and fail."""
+        self.sessions.append(session)
+        raise RuntimeError(f"store {value} failed")
+
+    @pytest.mark.asyncio
+    async def test_concurrent_stores_share_one_session(self):
+        """Test stores queued together run in one batch and each caller gets its result."""
+        batcher = ReportBatcher()
+        batcher.start()
+
+        results = await asyncio.gather(*(batcher.submit(self.store, value) for value in (1, 2, 3)))
+        await batcher.stop()
+
+        assert results == [2, 4, 6]
+        assert len(self.sessions) == 3
+        assert len({id(session) for session in self.sessions}) == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_retries_stores_individually(self):
+        """Test one failing store does not fail the other stores of its batch."""
+        batcher = ReportBatcher()
+        batcher.start()
+
+        results = await asyncio.gather(
+            batcher.submit(self.store, 1),
+            batcher.submit(self.failing_store, 2),
+            batcher.submit(self.store, 3),
+            return_exceptions=True,
+        )
+        await batcher.stop()
+
+        assert results[0] == 2
+        assert isinstance(results[1], RuntimeError)
+        assert results[2] == 6
+
+    @pytest.mark.asyncio
+    async def test_submit_without_worker_runs_directly(self):
+        """Test submitting outside the application lifespan still stores the report."""
+        batcher = ReportBatcher()
+
+        assert await batcher.submit(self.store, 5) == 10
+
+    @pytest.mark.asyncio
+    async def test_worker_survives_failed_session_setup(self, monkeypatch):
+        """Test a batch whose session cannot be created fails its callers without stopping the worker."""
+        create_session = report_batcher_module.create_session
+        calls = []
+
+        def failing_once():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("database unavailable")
+            return create_session()
+
+        monkeypatch.setattr(report_batcher_module, "create_session", failing_once)
+        batcher = ReportBatcher()
+        batcher.start()
+
+        with pytest.raises(RuntimeError):
+            await batcher.submit(self.store, 1)
+        result = await batcher.submit(self.store, 2)
+        await batcher.stop()
+
+        assert result == 4
+
+
+class TestReportBatcherDatabase:
+    """Tests for match report stores sharing one batch transaction on a real database."""
+
+    @pytest.fixture(autouse=True)
+    def setup_database(self, monkeypatch):
+        """Point the batcher at a fresh in-memory database and count the sessions it opens."""
+        self.engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+        SQLModel.metadata.create_all(self.engine)
+        self.batch_sessions = 0
+
+        def create_session():
+            self.batch_sessions += 1
+            return Session(self.engine)
+
+        monkeypatch.setattr(report_batcher_module, "create_session", create_session)
+        yield
+        self.engine.dispose()
+
+    def create_match(self) -> tuple[list[int], str, list[str]]:
+        """Create two players, a competition session and their report intents."""
+        with Session(self.engine) as session:
+            persona_ids = []
+            for name in ("alice", "bobby"):
+                user = create_new_user(
+                    session, UserCreate(username=name, password="password123", email=f"{name}@example.com")
+                )
+                persona_ids.append(create_persona_for_user(session, user, name.title()).id)
+            comp_session = create_competition_session(session, persona_ids[0])
+            ccids = [
+                set_report_intention(session, comp_session.csid, comp_session.ccid, persona_id).ccid
+                for persona_id in persona_ids
+            ]
+            return persona_ids, comp_session.csid, ccids
+
+    def submit(self, csid: str, ccid: str, persona_id: int, players: list[tuple[int, bool, int]]):
+        """Parse a report the way the SubmitReport handler does."""
+        return handle_submit_report(csid, ccid, persona_id, build_report(players), "test", BackgroundTasks())
+
+    async def store_in_one_batch(self, *stores) -> list:
+        """Queue (store, submitted) pairs together so they are written as one batch."""
+        batcher = ReportBatcher()
+        batcher.start()
+        results = await asyncio.gather(
+            *(batcher.submit(store, submitted) for store, submitted in stores), return_exceptions=True
+        )
+        await batcher.stop()
+        return results
+
+    def submit_report_body(self, csid: str, ccid: str, persona_id: int, players: list[tuple[int, bool, int]]) -> bytes:
+        """Build a gzipped SubmitReport request body the way the game sends it."""
+        xml = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<SOAP-ENV:Envelope xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/" '
+            'xmlns:gsc="http://gamespy.net/competition/"><SOAP-ENV:Body><gsc:SubmitReport>'
+            f"<gsc:csid>{csid}</gsc:csid><gsc:ccid>{ccid}</gsc:ccid>"
+            f"<gsc:certificate><gsc:profileid>{persona_id}</gsc:profileid></gsc:certificate>"
+            "</gsc:SubmitReport></SOAP-ENV:Body></SOAP-ENV:Envelope>"
+        )
+        return gzip.compress(xml.encode() + b"application/bin\x00" + build_report(players))
+
+    def stored_results(self, csid: str) -> list[tuple[int, int]]:
+        """Get the (persona_id, result) of each report stored for a competition session."""
+        with Session(self.engine) as session:
+            return sorted((r.persona_id, r.result) for r in get_match_reports_for_session(session, csid))
+
+    @pytest.mark.asyncio
+    async def test_partial_and_final_reports_in_one_batch(self):
+        """Test a final report resolves its result against a partial report flushed earlier in the same batch."""
+        persona_ids, csid, ccids = self.create_match()
+        # Persona ids in the roster do not match the submitters, so the final report's
+        # result can only come from elimination against the partial report
+        final_players = [(777, True, 1), (888, False, 6)]
+        partial = self.submit(csid, ccids[0], persona_ids[0], final_players[:1])
+        final = self.submit(csid, ccids[1], persona_ids[1], final_players)
+
+        results = await self.store_in_one_batch((store_submitted_report, partial), (store_submitted_report, final))
+
+        assert [r.result.result for r in results] == [CompetitionResultCode.SUCCESS] * 2
+        assert self.batch_sessions == 1
+        assert self.stored_results(csid) == [(persona_ids[0], 0), (persona_ids[1], 1)]
+        with Session(self.engine) as session:
+            comp_session = get_competition_session(session, csid)
+            assert comp_session.received_reports == 2
+            assert comp_session.finalized
+
+    @pytest.mark.asyncio
+    async def test_failed_store_rolled_back_while_others_commit(self):
+        """Test a store failing mid-batch is rolled back and the other reports are still committed."""
+        persona_ids, csid, ccids = self.create_match()
+        partial = self.submit(csid, ccids[0], persona_ids[0], [(persona_ids[0], True, 1)])
+
+        def failing_store(session, submitted):
+            session.add(Persona(name="Ghost", user_id=1))
+            session.flush()
+            raise RuntimeError("store failed")
+
+        results = await self.store_in_one_batch((store_submitted_report, partial), (failing_store, partial))
+
+        assert results[0].result.result == CompetitionResultCode.SUCCESS
+        assert isinstance(results[1], RuntimeError)
+        # One batch session, then one session per store for the individual retries
+        assert self.batch_sessions == 3
+        assert self.stored_results(csid) == [(persona_ids[0], 0)]
+        with Session(self.engine) as session:
+            assert session.exec(select(Persona).where(Persona.name == "Ghost")).first() is None
+
+    def test_submit_report_route_stores_through_batcher(self, monkeypatch):
+        """Test gzipped SubmitReport requests are dispatched by SOAPAction and stored by the report batcher."""
+        monkeypatch.setattr(competition_service, "REPORT_DUMP_MODE", "none")
+        persona_ids, csid, ccids = self.create_match()
+        players = [(persona_ids[0], True, 1), (persona_ids[1], False, 6)]
+
+        @asynccontextmanager
+        async def lifespan(_):
+            report_batcher.start()
+            yield
+            await report_batcher.stop()
+
+        app = FastAPI(lifespan=lifespan)
+        app.include_router(competition_router)
+        with TestClient(app) as client:
+            for index, submitted_players in ((0, players[:1]), (1, players)):
+                response = client.post(
+                    "/competitionservice/competitionservice.asmx",
+                    content=self.submit_report_body(csid, ccids[index], persona_ids[index], submitted_players),
+                    headers={"SOAPAction": '"http://gamespy.net/competition/SubmitReport"'},
+                )
+                assert response.status_code == 200
+                assert b"<result>0</result>" in response.content
+
+        # One batch per request, and no other sessions on the way
+        assert self.batch_sessions == 2
+        assert self.stored_results(csid) == [(persona_ids[0], 0), (persona_ids[1], 1)]
+        with Session(self.engine) as session:
+            comp_session = get_competition_session(session, csid)
+            assert comp_session.received_reports == 2
+            assert comp_session.finalized
@@ -8,14 +8,33 @@ Tests the XML serialization and response patterns for:
 """
 
 import base64
+import gzip
+import tracemalloc
+import zlib
 
 import pytest
 from sqlmodel import SQLModel
 
 from app.db.database import engine
-from app.soap.envelope import extract_soap_body, get_element_text, wrap_soap_envelope
+from app.soap.auth_service import _LOGIN_SUCCESS_TEMPLATE
+from app.soap.competition_service import (
+    _gunzip,
+    extract_submit_report_data,
+    parse_operation_fields,
+    render_create_session,
+    render_set_report_intention,
+)
+from app.soap.envelope import (
+    extract_soap_body,
+    get_child_element,
+    get_element_text,
+    get_elements_text,
+    get_operation_name,
+    wrap_soap_envelope,
+    wrap_soap_envelope_bytes,
+)
 from app.soap.models.auth import LoginRemoteAuthResponse, LoginResponseCode
-from app.soap.models.common import RecordValue
+from app.soap.models.common import ArrayOfRecordValue, RecordValue
 from app.soap.models.competition import (
     CreateSessionResponse,
     SetReportIntentionResponse,
@@ -33,6 +52,7 @@ from app.soap.sake_service import (
     handle_get_specific_records,
     handle_search_for_records,
     parse_login_ticket,
+    render_search_for_records,
 )
 
 # Valid test login ticket: base64("12345|67890|testtoken")
@@ -119,6 +139,19 @@ class TestSakeService:
         assert "SearchForRecordsResponse" in xml
         assert "<SearchForRecordsResult>Success</SearchForRecordsResult>" in xml
 
+    def test_render_search_for_records_matches_model(self):
+        """Test the directly serialized SearchForRecords envelope matches the model serialization."""
+        for table_id, filter_str, login_ticket in (
+            ("Levels", "", VALID_LOGIN_TICKET),
+            ("PlayerStats_v5", "ownerid=67890", VALID_LOGIN_TICKET),
+            ("NewsTicker", "", VALID_LOGIN_TICKET),
+            ("Levels", "", "invalid_ticket"),
+        ):
+            response = handle_search_for_records(table_id, filter_str, login_ticket)
+            assert render_search_for_records(table_id, filter_str, login_ticket) == wrap_soap_envelope(response).encode(
+                "utf-8"
+            )
+
     def test_search_for_records_invalid_login_ticket(self):
         """Test SearchForRecords returns LoginTicketInvalid for invalid ticket."""
         response = handle_search_for_records("Levels", "", "invalid_ticket")
@@ -190,6 +223,118 @@ class TestCompetitionModels:
         assert "<csid>session123</csid>" in xml
         assert "<ccid>channel789</ccid>" in xml
 
+    def test_set_report_intention_template_matches_model(self):
+        """Test the pre-rendered SetReportIntention template renders the same as the model."""
+        response = SetReportIntentionResponse.success(csid="pdvJ7PdZZvS-MLO_5a_i0Q", ccid="AAAAAg3SmjVFWtdx0")
+
+        assert render_set_report_intention(response) == wrap_soap_envelope(response).encode("utf-8")
+
+    def test_create_session_template_matches_model(self):
+        """Test the pre-rendered CreateSession template renders the same as the model."""
+        response = CreateSessionResponse.success(csid="pdvJ7PdZZvS-MLO_5a_i0Q", ccid="AAAAAg3SmjVFWtdx0")
+
+        assert render_create_session(response) == wrap_soap_envelope(response).encode("utf-8")
+        error = CreateSessionResponse.error(code=1)
+        assert render_create_session(error) == wrap_soap_envelope(error).encode("utf-8")
+
+    def test_set_report_intention_template_encodes_non_ascii_ids(self):
+        """Test the template renders non-ASCII ids as UTF-8, like the model serialization."""
+        response = SetReportIntentionResponse.success(csid="sessión123", ccid="channel789")
+
+        assert render_set_report_intention(response) == wrap_soap_envelope(response).encode("utf-8")
+
+    def test_set_report_intention_template_escapes_unsafe_ids(self):
+        """Test ids that need XML escaping are escaped by the template."""
+        response = SetReportIntentionResponse.success(csid="<csid>&", ccid="channel789")
+        xml = render_set_report_intention(response)
+
+        assert b"<csid>&lt;csid&gt;&amp;</csid>" in xml
+        assert b"<ccid>channel789</ccid>" in xml
+
+    def test_wrap_soap_envelope_bytes_matches_str(self):
+        """Test the bytes envelope is the UTF-8 encoding of the str envelope."""
+        response = CreateSessionResponse.success(csid="sessión123", ccid="channel456")
+
+        assert wrap_soap_envelope_bytes(response) == wrap_soap_envelope(response).encode("utf-8")
+
+    def test_parse_operation_fields(self):
+        """Test the operation name, csid, ccid and certificate profileid are read in one pass."""
+        body = b"""<?xml version="1.0" encoding="utf-8"?>
+<soap:Envelope xmlns:soap="http://schemas.xmlsoap.org/soap/envelope/" xmlns:gsc="http://gamespy.net/competition/">
+    <soap:Body>
+        <gsc:SetReportIntention>
+            <gsc:certificate><gsc:userid>7</gsc:userid><gsc:profileid>42</gsc:profileid></gsc:certificate>
+            <gsc:csid>session123</gsc:csid>
+            <gsc:ccid>channel&amp;456</gsc:ccid>
+            <gsc:profileid>99</gsc:profileid>
+        </gsc:SetReportIntention>
+    </soap:Body>
+</soap:Envelope>"""
+
+        operation_name, fields = parse_operation_fields(body)
+
+        assert operation_name == "SetReportIntention"
+        assert fields == {"profileid": "42", "csid": "session123", "ccid": "channel&456"}
+
+    def test_parse_operation_fields_missing_operation(self):
+        """Test a SOAP envelope without an operation raises ValueError."""
+        with pytest.raises(ValueError):
+            parse_operation_fields(
+                b'<e:Envelope xmlns:e="http://schemas.xmlsoap.org/soap/envelope/"><e:Body/></e:Envelope>'
+            )
+
+    def test_extract_submit_report_data(self):
+        """Test SubmitReport fields are read from the XML part and the report follows the binary marker."""
+        body = (
+            b"<gsc:csid>session123</gsc:csid><gsc:ccid>channel456</gsc:ccid>"
+            b"<gsc:userid>7</gsc:userid><gsc:profileid>42</gsc:profileid>"
+            b"application/bin\x00<gsc:profileid>99</gsc:profileid>"
+        )
+
+        csid, ccid, profile_id, raw_report = extract_submit_report_data(body, "test")
+
+        assert (csid, ccid, profile_id) == ("session123", "channel456", 42)
+        assert bytes(raw_report) == b"<gsc:profileid>99</gsc:profileid>"
+
+    def test_extract_submit_report_data_any_order_and_fallback(self):
+        """Test fields are found in any order, and values with markup fall back to the marker search."""
+        body = b"<gsc:profileid>42</gsc:profileid><gsc:ccid>channel456</gsc:ccid><gsc:csid>a<b/></gsc:csid>"
+
+        csid, ccid, profile_id, _ = extract_submit_report_data(body, "test")
+
+        assert (csid, ccid, profile_id) == ("a<b/>", "channel456", 42)
+
+    def test_extract_submit_report_data_missing_fields(self):
+        """Test missing or invalid fields fall back to empty values."""
+        csid, ccid, profile_id, raw_report = extract_submit_report_data(b"<gsc:profileid>x</gsc:profileid>", "test")
+
+        assert (csid, ccid, profile_id, len(raw_report)) == ("", "", 0, 0)
+
+    def test_gunzip_matches_gzip_decompress(self):
+        """Test request bodies decompress the same as gzip.decompress, including multiple members."""
+        large = b"<gsc:csid>session123</gsc:csid>" * 5000
+        for data in (b"", large, gzip.compress(large) + b"tail"):
+            assert _gunzip(gzip.compress(data)) == data
+        assert _gunzip(gzip.compress(large) + gzip.compress(b"second")) == large + b"second"
+
+    def test_gunzip_truncated_raises(self):
+        """Test a body cut off before the end of the gzip stream is rejected."""
+        with pytest.raises(EOFError):
+            _gunzip(gzip.compress(b"<gsc:csid>session123</gsc:csid>" * 100)[:-10])
+
+    def test_gunzip_forged_size_footer_does_not_preallocate(self):
+        """Test a tiny body claiming a huge uncompressed size is rejected without a large allocation."""
+        forged = gzip.compress(b"x")[:-4] + (2**32 - 1).to_bytes(4, "little")
+        tracemalloc.start()
+        try:
+            with pytest.raises(zlib.error):
+                _gunzip(forged)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert peak < 1024 * 1024
+
     def test_submit_report_response_success(self):
         """Test SubmitReportResponse success serialization."""
         response = SubmitReportResponse.success()
@@ -245,6 +390,35 @@ class TestAuthModels:
         assert "<partnercode>60</partnercode>" in xml
         assert "<namespaceid>69</namespaceid>" in xml
 
+    def test_login_success_template_matches_model(self):
+        """Test the pre-rendered success template renders the same as the model, escaping text."""
+        response = LoginRemoteAuthResponse.success(
+            user_id=12345,
+            profile_id=67890,
+            nickname="Test<&>Player",
+            email="test@example.com",
+            peerkeymodulus="ABC123DEF456",
+            serverdata="SERVERDATA789",
+            signature="SIGNATURE000",
+            peerkeyprivate="PRIVATEKEY111",
+            timestamp="1234567890",
+        )
+        xml = _LOGIN_SUCCESS_TEMPLATE.render(
+            {
+                "__USERID__": 12345,
+                "__PROFILEID__": 67890,
+                "__NICKNAME__": "Test<&>Player",
+                "__EMAIL__": "test@example.com",
+                "__PEERKEYMODULUS__": "ABC123DEF456",
+                "__SERVERDATA__": "SERVERDATA789",
+                "__SIGNATURE__": "SIGNATURE000",
+                "__TIMESTAMP__": "1234567890",
+                "__PEERKEYPRIVATE__": "PRIVATEKEY111",
+            }
+        )
+
+        assert xml == wrap_soap_envelope(response)
+
     def test_login_remote_auth_response_error_user_not_found(self):
         """Test LoginRemoteAuthResponse error with USER_NOT_FOUND code."""
         response = LoginRemoteAuthResponse.error(LoginResponseCode.USER_NOT_FOUND)
@@ -272,6 +446,56 @@ class TestAuthModels:
         assert "<responseCode>4</responseCode>" in xml
 
 
+class TestSoapEnvelopeParsing:
+    """Tests for SOAP envelope request parsing."""
+
+    REQUEST = """<?xml version="1.0" encoding="UTF-8"?>
+<SOAP-ENV:Envelope xmlns:SOAP-ENV="http://schemas.xmlsoap.org/soap/envelope/"
+                   xmlns:gsc="http://gamespy.net/competition/">
+    <!-- leading comment -->
+    <SOAP-ENV:Body>
+        <gsc:SetReportIntention>
+            <gsc:csid>abc123</gsc:csid>
+            <gsc:certificate>
+                <gsc:profileid>67890</gsc:profileid>
+            </gsc:certificate>
+            <plain>value</plain>
+        </gsc:SetReportIntention>
+    </SOAP-ENV:Body>
+</SOAP-ENV:Envelope>"""
+
+    def test_extract_soap_body_from_str_and_bytes(self):
+        """Test requests with an encoding declaration parse from both str and bytes."""
+        for content in (self.REQUEST, self.REQUEST.encode("utf-8")):
+            operation = extract_soap_body(content)
+            assert get_operation_name(operation) == "SetReportIntention"
+
+    def test_get_element_text_matches_direct_children_only(self):
+        """Test element lookups ignore namespaces but not nesting."""
+        operation = extract_soap_body(self.REQUEST)
+
+        assert get_element_text(operation, "csid") == "abc123"
+        assert get_element_text(operation, "plain") == "value"
+        assert get_element_text(operation, "profileid") == ""
+
+        certificate = get_child_element(operation, "certificate")
+        assert certificate is not None
+        assert get_element_text(certificate, "profileid") == "67890"
+
+    def test_get_elements_text_single_pass(self):
+        """Test several child texts are returned together, with missing tags empty."""
+        operation = extract_soap_body(self.REQUEST)
+
+        texts = get_elements_text(operation, ("csid", "plain", "missing", "profileid"))
+
+        assert texts == {"csid": "abc123", "plain": "value", "missing": "", "profileid": ""}
+
+    def test_extract_soap_body_missing_body(self):
+        """Test a SOAP envelope without a Body raises ValueError."""
+        with pytest.raises(ValueError):
+            extract_soap_body(b'<e:Envelope xmlns:e="http://schemas.xmlsoap.org/soap/envelope/"/>')
+
+
 class TestRecordValueSerialization:
     """Tests for RecordValue model serialization."""
 
@@ -291,6 +515,16 @@ class TestRecordValueSerialization:
         assert "<RecordValue>" in xml
         assert "<floatValue><value>3.14</value></floatValue>" in xml
 
+    def test_array_xml_from_ints_matches_model(self):
+        """Test directly serialized arrays match the RecordValue model serialization."""
+        for values in ([42, -7, 0], []):
+            assert ArrayOfRecordValue.xml_from_ints(values) == ArrayOfRecordValue.from_ints(values).to_xml(
+                encoding="unicode"
+            )
+            assert ArrayOfRecordValue.xml_from_shorts(values) == ArrayOfRecordValue.from_shorts(values).to_xml(
+                encoding="unicode"
+            )
+
     def test_record_value_from_short(self):
         """Test RecordValue.from_short serializes correctly."""
         record = RecordValue.from_short(100)